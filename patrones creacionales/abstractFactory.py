@@ -1,5 +1,12 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import wraps
+from threading import Lock
+from typing import Callable, Dict, List, Tuple, Union
+import sys
 
 
 class AbstractFactory(ABC):
@@ -19,6 +26,55 @@ class AbstractFactory(ABC):
     def create_product_b(self) -> AbstractProductB:
         pass
 
+    """
+    Batch creation. The defaults just call the single-product methods; concrete
+    factories whose products are stateless override them to return a compact
+    ProductBatch instead of n separate objects.
+    """
+
+    def create_many_a(self, n: int) -> Sequence:
+        return [self.create_product_a() for _ in range(n)]
+
+    def create_many_b(self, n: int) -> Sequence:
+        return [self.create_product_b() for _ in range(n)]
+
+    def create_family_batch(self, n: int) -> Tuple[Sequence, Sequence]:
+        """
+        Returns `n` A products and `n` B products; the i-th of each form a pair.
+        """
+        return self.create_many_a(n), self.create_many_b(n)
+
+
+class ProductBatch(Sequence):
+    """
+    Array-backed sequence of stateless products: one byte per item indexes a
+    small table of shared product instances, so a batch of millions costs
+    megabytes instead of one Python object per product.
+    """
+
+    def __init__(self, products: List, codes: array) -> None:
+        self._products = products
+        self._codes = codes
+
+    @classmethod
+    def uniform(cls, product, n: int) -> ProductBatch:
+        return cls([product], array("B", bytes(n)))
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return ProductBatch(self._products, self._codes[index])
+        return self._products[self._codes[index]]
+
+    def __iter__(self):
+        products = self._products
+        return (products[code] for code in self._codes)
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._codes) + sum(sys.getsizeof(p) for p in self._products)
+
 
 class ConcreteFactory1(AbstractFactory):
     """
@@ -34,6 +90,12 @@ class ConcreteFactory1(AbstractFactory):
     def create_product_b(self) -> AbstractProductB:
         return ConcreteProductB1()
 
+    def create_many_a(self, n: int) -> Sequence:
+        return ProductBatch.uniform(ConcreteProductA1(), n)
+
+    def create_many_b(self, n: int) -> Sequence:
+        return ProductBatch.uniform(ConcreteProductB1(), n)
+
 
 class ConcreteFactory2(AbstractFactory):
     """
@@ -46,6 +108,12 @@ class ConcreteFactory2(AbstractFactory):
     def create_product_b(self) -> AbstractProductB:
         return ConcreteProductB2()
 
+    def create_many_a(self, n: int) -> Sequence:
+        return ProductBatch.uniform(ConcreteProductA2(), n)
+
+    def create_many_b(self, n: int) -> Sequence:
+        return ProductBatch.uniform(ConcreteProductB2(), n)
+
 
 class AbstractProductA(ABC):
     """
@@ -58,6 +126,75 @@ class AbstractProductA(ABC):
         pass
 
 
+def pure_method(maxsize: int = 1024) -> Callable:
+    """
+    Opt-in memoization for product methods declared pure, i.e. whose result
+    only depends on the product variants involved and the arguments. Results
+    are kept in a bounded LRU cache keyed on the class of `self` and of every
+    product argument (other arguments by value), and the wrapped method gains
+    `cache_info()` with hit/miss counters and `cache_clear()`. Calls with an
+    unhashable argument simply run the method, uncached and uncounted.
+
+    A hit still costs a key build and a locked dictionary lookup, so this only
+    pays off when the method (or the collaborator it calls) does real work;
+    apply it to such methods only, e.g. in a subclass of a product.
+    """
+    products = (AbstractProductA, AbstractProductB)
+
+    def decorator(method: Callable) -> Callable:
+        cache = OrderedDict()
+        lock = Lock()
+        stats = [0, 0]
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if len(args) == 1 and not kwargs:
+                arg = args[0]
+                key = (type(self), type(arg) if isinstance(arg, products) else arg)
+            else:
+                key = (type(self), *[type(arg) if isinstance(arg, products) else arg
+                                     for arg in args])
+                if kwargs:
+                    key += tuple(sorted(
+                        (name, type(arg) if isinstance(arg, products) else arg)
+                        for name, arg in kwargs.items()))
+            with lock:
+                try:
+                    result = cache[key]
+                except KeyError:
+                    pass
+                except TypeError: #algun argumento no es hashable
+                    key = None
+                else:
+                    cache.move_to_end(key)
+                    stats[0] += 1
+                    return result
+
+            result = method(self, *args, **kwargs)
+            if key is None:
+                return result
+            with lock:
+                stats[1] += 1
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False) #se descarta el menos usado
+            return result
+
+        def cache_info() -> Dict[str, int]:
+            return {"hits": stats[0], "misses": stats[1], "size": len(cache),
+                    "maxsize": maxsize}
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                stats[:] = [0, 0]
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
 """
 Concrete Products are created by corresponding Concrete Factories.
 """
@@ -144,6 +281,71 @@ def client_code(factory: AbstractFactory) -> None:
     print(f"{product_b.another_useful_function_b(product_a)}", end="")
 
 
+def benchmark(n: int = 10_000_000) -> None:
+    """
+    Builds `n` product pairs one at a time and with `create_family_batch`.
+    """
+    from time import perf_counter
+
+    factory = ConcreteFactory1()
+
+    start = perf_counter()
+    products_a, products_b = [], []
+    for _ in range(n):
+        products_a.append(factory.create_product_a())
+        products_b.append(factory.create_product_b())
+    single = perf_counter() - start
+    single_bytes = (sys.getsizeof(products_a) + sys.getsizeof(products_b)
+                    + n * (sys.getsizeof(products_a[0]) + sys.getsizeof(products_b[0])))
+    del products_a, products_b
+
+    start = perf_counter()
+    batch_a, batch_b = factory.create_family_batch(n)
+    batch = perf_counter() - start
+    batch_bytes = batch_a.nbytes() + batch_b.nbytes()
+
+    print(f"{n} product pairs:")
+    print(f"  one at a time:       {single:.2f}s, {single_bytes / 2**20:.0f} MiB")
+    print(f"  create_family_batch: {batch:.4f}s, {batch_bytes / 2**20:.0f} MiB")
+
+
+class _SlowProductA1(ConcreteProductA1):
+    def useful_function_a(self) -> str:
+        return "".join(sorted(super().useful_function_a() * 20))
+
+
+class _MemoizedProductB1(ConcreteProductB1):
+    another_useful_function_b = pure_method()(ConcreteProductB1.another_useful_function_b)
+
+
+class _MemoizedProductB2(ConcreteProductB2):
+    another_useful_function_b = pure_method()(ConcreteProductB2.another_useful_function_b)
+
+
+def benchmark_memoization(n: int = 2_000_000) -> None:
+    """
+    Pairs the products of both families `n` times, as `client_code` does, with
+    and without the memoized `another_useful_function_b`, first with the plain
+    products and then with a collaborator whose `useful_function_a` is costly.
+    """
+    from time import perf_counter
+
+    for label, collaborators in (("plain", (ConcreteProductA1(), ConcreteProductA2())),
+                                 ("costly", (_SlowProductA1(), ConcreteProductA2()))):
+        for name, products_b in (
+                ("uncached", (ConcreteProductB1(), ConcreteProductB2())),
+                ("memoized", (_MemoizedProductB1(), _MemoizedProductB2()))):
+            pairs = list(zip(collaborators, products_b))
+            _MemoizedProductB1.another_useful_function_b.cache_clear()
+            _MemoizedProductB2.another_useful_function_b.cache_clear()
+            start = perf_counter()
+            for i in range(n):
+                product_a, product_b = pairs[i & 1]
+                product_b.another_useful_function_b(product_a)
+            print(f"{label} collaborator, {name}: {n / (perf_counter() - start):,.0f} calls/s")
+    print(f"B1 cache: {_MemoizedProductB1.another_useful_function_b.cache_info()}")
+
+
 if __name__ == "__main__":
     """
     The client code can work with any concrete factory class.
@@ -155,5 +357,22 @@ if __name__ == "__main__":
 
     print("Client: Testing the same client code with the second factory type:")
     client_code(ConcreteFactory2())
-    
-    
\ No newline at end of file
+
+    print("\n")
+
+    print("Client: Creating a batch of product pairs:")
+    products_a, products_b = ConcreteFactory2().create_family_batch(3)
+    for product_a, product_b in zip(products_a, products_b):
+        print(product_b.another_useful_function_b(product_a))
+    print("\n")
+
+    print("Client: Memoizing a pure product method is opt-in:")
+    product_b = _MemoizedProductB1()
+    for _ in range(3):
+        product_b.another_useful_function_b(collaborator=ConcreteProductA1())
+    print(f"Client: Cache stats: {_MemoizedProductB1.another_useful_function_b.cache_info()}")
+
+    if "--bench" in sys.argv:
+        print("")
+        benchmark()
+        benchmark_memoization()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+import sys
 
 
 class Builder(ABC):
@@ -94,6 +98,67 @@ class Product1():
         print(f"Product parts: {', '.join(self.parts)}", end="")
 
 
+class CompactProduct1():
+    """
+    Same interface as Product1, but with `__slots__` instead of a per-instance
+    `__dict__`, which makes every product smaller and faster to create.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self) -> None:
+        self.parts = []
+
+    def add(self, part: Any) -> None:
+        self.parts.append(part)
+
+    def list_parts(self) -> None:
+        print(f"Product parts: {', '.join(self.parts)}", end="")
+
+
+class PooledBuilder1(ConcreteBuilder1):
+    """
+    A ConcreteBuilder1 that recycles products. Once the client is done with a
+    product it hands it back with `release()`; its parts are cleared in place
+    and it goes to a bounded free list that `reset()` takes from before
+    allocating a new one. A released product must not be used afterwards, and
+    releasing it twice, or releasing the product still being built, is an
+    error.
+    """
+
+    def __init__(self, pool_size: int = 1024, product_class: type = CompactProduct1) -> None:
+        self._free = []
+        self._pooled = set() #ids de los productos en la lista libre
+        self._pool_size = pool_size
+        self._product_class = product_class
+        self._allocated = 0
+        self._reused = 0
+        super().__init__()
+
+    def reset(self) -> None:
+        if self._free:
+            self._product = self._free.pop()
+            self._pooled.discard(id(self._product))
+            self._reused += 1
+        else:
+            self._product = self._product_class()
+            self._allocated += 1
+
+    def release(self, product: CompactProduct1) -> None:
+        if id(product) in self._pooled:
+            raise ValueError("This product has already been released")
+        if product is self._product:
+            raise ValueError("Can't release the product that is being built")
+        if len(self._free) < self._pool_size:
+            product.parts.clear() #se reutiliza la misma lista
+            self._free.append(product)
+            self._pooled.add(id(product))
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"allocated": self._allocated, "reused": self._reused,
+                "free": len(self._free)}
+
+
 class Director:
     """
     The Director is only responsible for executing the building steps in a
@@ -131,6 +196,222 @@ class Director:
         self.builder.produce_part_b()
         self.builder.produce_part_c()
 
+    def record(self, build: Callable[[], None]) -> BuildPlan:
+        """
+        Runs one of the Director's build methods (e.g.
+        `director.record(director.build_full_featured_product)`) against a
+        recording builder and returns the sequence of steps it took as a
+        reusable BuildPlan.
+        """
+        builder, self._builder = self._builder, _RecordingBuilder()
+        try:
+            build()
+            return BuildPlan(self._builder.steps)
+        finally:
+            self._builder = builder
+
+
+class _RecordingBuilder(Builder):
+    """
+    Remembers which building steps are called instead of building anything.
+    """
+
+    def __init__(self) -> None:
+        self.steps = []
+
+    @property
+    def product(self) -> None:
+        return None
+
+    def produce_part_a(self) -> None:
+        self.steps.append("produce_part_a")
+
+    def produce_part_b(self) -> None:
+        self.steps.append("produce_part_b")
+
+    def produce_part_c(self) -> None:
+        self.steps.append("produce_part_c")
+
+
+class BuildPlan:
+    """
+    A recorded sequence of building steps. Replaying binds the steps to the
+    builder once and calls them from a tuple, instead of going through the
+    Director and looking each step up again for every product.
+    """
+
+    def __init__(self, steps: List[str]) -> None:
+        self._steps = tuple(steps)
+
+    @property
+    def steps(self) -> Tuple[str, ...]:
+        return self._steps
+
+    def _bind(self, builder: Builder) -> Tuple[Callable[[], None], ...]:
+        return tuple(getattr(builder, step) for step in self._steps)
+
+    def replay(self, builder: Builder) -> Any:
+        for step in self._bind(builder):
+            step()
+        return builder.product
+
+    def replay_many(self, builder: Builder, n: int) -> List[Any]:
+        steps = self._bind(builder)
+        products = []
+        for _ in range(n):
+            for step in steps:
+                step()
+            products.append(builder.product)
+        return products
+
+    def template(self, builder: Builder) -> PartsTemplate:
+        """
+        Builds one product and keeps its parts, so further products can be
+        produced by copying them. Only valid for builders whose steps always
+        add the same parts.
+        """
+        product = self.replay(builder)
+        return PartsTemplate(type(product), product.parts)
+
+
+class PartsTemplate:
+    """
+    A ready-made parts list: every product it creates gets a copy of it without
+    running any building step.
+    """
+
+    def __init__(self, product_class: type, parts: List[Any]) -> None:
+        self._product_class = product_class
+        self._parts = tuple(parts)
+
+    def create(self) -> Any:
+        product = self._product_class.__new__(self._product_class)
+        product.parts = list(self._parts)
+        return product
+
+    def create_many(self, n: int) -> List[Any]:
+        product_class, parts = self._product_class, self._parts
+        products = [product_class.__new__(product_class) for _ in range(n)]
+        for product in products:
+            product.parts = list(parts)
+        return products
+
+
+def _build_products(builder: Builder, specs: Iterable[Tuple[str, ...]]) -> Iterator[Any]:
+    steps = {}
+    for spec in specs:
+        for step in spec:
+            if step not in steps: #cada paso se enlaza al builder una sola vez
+                steps[step] = getattr(builder, step)
+            steps[step]()
+        yield builder.product
+
+
+def _build_batch(builder_class: type, batch: List[Tuple[str, ...]]) -> Tuple[type, List[Tuple[Any, ...]]]:
+    """
+    Runs in a worker process. Products travel back in compact form: their
+    class once per batch and a tuple of parts per product, rather than one
+    pickled object (and `__dict__`) each.
+    """
+    products = list(_build_products(builder_class(), batch))
+    product_class = type(products[0]) if products else None
+    return product_class, [tuple(product.parts) for product in products]
+
+
+def _unpack_batch(product_class: type, batch: List[Tuple[Any, ...]]) -> Iterator[Any]:
+    for parts in batch:
+        product = product_class.__new__(product_class)
+        product.parts = list(parts)
+        yield product
+
+
+def build_stream(specs: Iterable[Union[BuildPlan, Sequence[str]]],
+                 builder_class: type = ConcreteBuilder1, workers: int = 0,
+                 batch_size: int = 1024) -> Iterator[Any]:
+    """
+    Builds one product per specification (a BuildPlan or a sequence of step
+    names) and yields them in the order of `specs`, which may be an unbounded
+    stream.
+
+    With `workers`, batches of `batch_size` specifications are built on a
+    process pool. At most two batches per worker are in flight, so memory stays
+    bounded however long the stream is, and results are yielded in submission
+    order, exactly as the sequential builder would produce them.
+    """
+    specs = (spec.steps if isinstance(spec, BuildPlan) else tuple(spec) for spec in specs)
+    if not workers:
+        yield from _build_products(builder_class(), specs)
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        while True:
+            batch = list(islice(specs, batch_size))
+            if batch:
+                pending.append(pool.submit(_build_batch, builder_class, batch))
+            if pending and (len(pending) >= 2 * workers or not batch):
+                yield from _unpack_batch(*pending.popleft().result())
+            elif not batch:
+                return
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    """
+    Builds and discards `n` full featured products with ConcreteBuilder1 and
+    with PooledBuilder1, counting product allocations and throughput.
+    """
+    from time import perf_counter
+
+    director = Director()
+    for builder in (ConcreteBuilder1(), PooledBuilder1()):
+        director.builder = builder
+        pooled = isinstance(builder, PooledBuilder1)
+
+        start = perf_counter()
+        for _ in range(n):
+            director.build_full_featured_product()
+            product = builder.product
+            if pooled:
+                builder.release(product)
+        elapsed = perf_counter() - start
+
+        # Cada Product1/CompactProduct1 nuevo tambien reserva su lista de partes
+        products = builder.get_stats()["allocated"] if pooled else n + 1
+        print(f"{type(builder).__name__}: {n / elapsed:,.0f} products/s, "
+              f"{products} products (and parts lists) allocated")
+
+
+def benchmark_plans(n: int = 1_000_000) -> None:
+    """
+    Builds `n` full featured products with the Director loop, by replaying a
+    recorded BuildPlan and by copying a PartsTemplate.
+    """
+    from time import perf_counter
+
+    director = Director()
+    director.builder = ConcreteBuilder1()
+    plan = director.record(director.build_full_featured_product)
+
+    def director_loop():
+        builder = director.builder
+        products = []
+        for _ in range(n):
+            director.build_full_featured_product()
+            products.append(builder.product)
+        return products
+
+    for name, build in (
+            ("Director loop", director_loop),
+            ("BuildPlan.replay_many", lambda: plan.replay_many(ConcreteBuilder1(), n)),
+            ("PartsTemplate.create_many",
+             lambda: plan.template(ConcreteBuilder1()).create_many(n))):
+        start = perf_counter()
+        products = build()
+        elapsed = perf_counter() - start
+        assert products[-1].parts == ["PartA1", "PartB1", "PartC1"]
+        print(f"{name}: {elapsed:.2f}s for {n} products")
+        del products
+
 
 if __name__ == "__main__":
     """
@@ -160,4 +441,35 @@ if __name__ == "__main__":
     builder.produce_part_a()
     builder.produce_part_b()
     builder.product.list_parts()
-    
\ No newline at end of file
+
+    print("\n")
+
+    # Los productos liberados se reciclan en lugar de crear nuevos
+    builder = PooledBuilder1(pool_size=8)
+    director.builder = builder
+    for _ in range(3):
+        director.build_full_featured_product()
+        product = builder.product
+        builder.release(product)
+    print(f"Pooled builder: {builder.get_stats()}")
+    print("")
+
+    # Un plan grabado se repite sin volver a pasar por el Director
+    plan = director.record(director.build_full_featured_product)
+    print(f"Recorded plan: {plan.steps}")
+    for product in plan.replay_many(ConcreteBuilder1(), 2):
+        product.list_parts()
+        print("")
+    plan.template(ConcreteBuilder1()).create().list_parts()
+    print("\n")
+
+    # Construccion en lote a partir de un flujo de especificaciones
+    specs = [plan, ["produce_part_a"], ["produce_part_c", "produce_part_b"]]
+    for product in build_stream(specs, workers=2, batch_size=2):
+        product.list_parts()
+        print("")
+
+    if "--bench" in sys.argv:
+        print("\n")
+        benchmark()
+        benchmark_plans()
@@ -1,5 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from importlib import import_module
+from time import perf_counter
+from typing import Any, Dict, List, Mapping, Tuple, Type, Union
+import json
+import sys
 
 
 class Creator(ABC):
@@ -9,6 +14,16 @@ class Creator(ABC):
     implementation of this method.
     """
 
+    _cache_products: bool = False
+    _product: Product = None
+
+    def __init__(self, cache_products: bool = False) -> None:
+        """
+        With `cache_products`, a stateless product is created once and reused
+        by every call to `some_operation`.
+        """
+        self._cache_products = cache_products
+
     @abstractmethod
     def factory_method(self):
         """
@@ -27,13 +42,23 @@ class Creator(ABC):
         """
 
         # Call the factory method to create a Product object.
-        product = self.factory_method()
+        product = self.get_product()
 
         # Now, use the product.
         result = f"Creator: The same creator's code has just worked with {product.operation()}"
 
         return result
 
+    def get_product(self) -> Product:
+        if not self._cache_products:
+            return self.factory_method()
+        if self._product is None:
+            product = self.factory_method()
+            if not product.stateless:
+                return product
+            self._product = product
+        return self._product
+
 
 """
 Concrete Creators override the factory method in order to change the resulting
@@ -63,6 +88,12 @@ class Product(ABC):
     must implement.
     """
 
+    """
+    Products that hold no per-use state can be shared safely, so Creators are
+    allowed to cache them.
+    """
+    stateless: bool = False
+
     @abstractmethod
     def operation(self) -> str:
         pass
@@ -74,15 +105,125 @@ Concrete Products provide various implementations of the Product interface.
 
 
 class ConcreteProduct1(Product):
+    stateless = True
+
     def operation(self) -> str:
         return "{Result of the ConcreteProduct1}"
 
 
 class ConcreteProduct2(Product):
+    stateless = True
+
     def operation(self) -> str:
         return "{Result of the ConcreteProduct2}"
 
 
+class CreatorRegistry:
+    """
+    Chooses the creator by product type instead of leaving that branching to
+    the client. Each type gets a single creator instance, reused across calls.
+
+    Creators can also be registered lazily as a "module:Class" string, usually
+    from a manifest; the module is only imported the first time its product
+    type is requested, and the import is timed.
+    """
+
+    def __init__(self) -> None:
+        self._creators: Dict[str, Tuple[Union[Type[Creator], str], bool]] = {}
+        self._instances: Dict[str, Creator] = {}
+        self._imports: Dict[str, float] = {}
+
+    def register(self, product_type: str, creator_class: Union[Type[Creator], str],
+                 cache_products: bool = False) -> None:
+        self._creators[product_type] = (creator_class, cache_products)
+        self._instances.pop(product_type, None)
+        self._imports.pop(product_type, None)
+
+    def load_manifest(self, manifest: Union[str, Mapping[str, str]],
+                      cache_products: bool = False) -> None:
+        """
+        Registers every entry of a manifest mapping product types to
+        "module:Class" targets, given as a dict or as the path of a JSON file.
+        Nothing is imported yet.
+        """
+        if isinstance(manifest, str):
+            with open(manifest, encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        for product_type, target in manifest.items():
+            self.register(product_type, target, cache_products)
+
+    def get(self, product_type: str) -> Creator:
+        creator = self._instances.get(product_type)
+        if creator is None:
+            try:
+                creator_class, cache_products = self._creators[product_type]
+            except KeyError:
+                raise KeyError(f"No creator registered for {product_type!r}") from None
+            if isinstance(creator_class, str):
+                creator_class = self._import_creator(product_type, creator_class)
+                self._creators[product_type] = (creator_class, cache_products)
+            creator = creator_class(cache_products)
+            self._instances[product_type] = creator
+        return creator
+
+    def _import_creator(self, product_type: str, target: str) -> Type[Creator]:
+        module_name, _, class_name = target.partition(":")
+        start = perf_counter()
+        creator_class = getattr(import_module(module_name), class_name)
+        self._imports[product_type] = perf_counter() - start
+        return creator_class
+
+    def import_report(self) -> List[Dict[str, Any]]:
+        """
+        Which lazily registered creators have been loaded so far, and how long
+        each import took.
+        """
+        report = []
+        for product_type, (creator_class, _) in self._creators.items():
+            if product_type in self._imports:
+                target = f"{creator_class.__module__}:{creator_class.__qualname__}"
+                report.append({"product_type": product_type, "target": target,
+                               "loaded": True, "import_time": self._imports[product_type]})
+            elif isinstance(creator_class, str):
+                report.append({"product_type": product_type, "target": creator_class,
+                               "loaded": False, "import_time": None})
+        return report
+
+    def some_operation(self, product_type: str) -> str:
+        return self.get(product_type).some_operation()
+
+
+registry = CreatorRegistry()
+registry.register("product1", ConcreteCreator1, cache_products=True)
+registry.register("product2", ConcreteCreator2, cache_products=True)
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    """
+    Request-path style workload: `n` calls of `some_operation`, choosing the
+    creator with client-side branching and a new product per call, versus the
+    registry with cached products.
+    """
+    from time import perf_counter
+
+    types = ("product1", "product2")
+
+    start = perf_counter()
+    for i in range(n):
+        creator = ConcreteCreator1() if types[i & 1] == "product1" else ConcreteCreator2()
+        creator.some_operation()
+    branching = perf_counter() - start
+
+    start = perf_counter()
+    for i in range(n):
+        registry.some_operation(types[i & 1])
+    cached = perf_counter() - start
+
+    print(f"{n} requests:")
+    print(f"  branching, new product per call: {n / branching:,.0f} req/s")
+    print(f"  registry, cached products:       {n / cached:,.0f} req/s")
+
+
 def client_code(creator: Creator) -> None:
     """
     The client code works with an instance of a concrete creator, albeit through
@@ -101,3 +242,24 @@ if __name__ == "__main__":
 
     print("App: Launched with the ConcreteCreator2.")
     client_code(ConcreteCreator2())
+    print("\n")
+
+    print("App: Launched through the creator registry.")
+    client_code(registry.get("product1"))
+    print("\n")
+
+    # Los creadores del manifiesto solo se importan cuando se piden. El plugin
+    # apunta a este mismo módulo por su __name__, para no importarlo dos veces
+    registry.load_manifest({"plugin2": f"{__name__}:ConcreteCreator2",
+                            "never_used": "missing_plugin:Creator"})
+    print("App: Launched through a lazily loaded plugin.")
+    client_code(registry.get("plugin2"))
+    print("")
+    for row in registry.import_report():
+        time = row["import_time"]
+        print(f"{row['product_type']} -> {row['target']}: loaded={row['loaded']} "
+              f"import={'-' if time is None else f'{time * 1e3:.1f} ms'}")
+
+    if "--bench" in sys.argv:
+        print("\n")
+        benchmark()
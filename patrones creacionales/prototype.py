@@ -1,4 +1,146 @@
+from collections import deque
+from collections.abc import MutableMapping, MutableSequence, MutableSet
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Event, Thread
+from types import BuiltinFunctionType, FunctionType
 import copy
+import io
+import pickle
+import sys
+
+
+"""
+Types whose instances can't change, so a clone can simply share them. Classes
+(instances of `type` or of any metaclass) are shared too, as `copy` does.
+"""
+_ATOMIC = frozenset({type(None), int, float, bool, complex, str, bytes, range,
+                     type(Ellipsis), type(NotImplemented), type, FunctionType,
+                     BuiltinFunctionType})
+
+_IMMUTABLE = "immutable"
+_SHALLOW = "shallow"
+_DEEP = "deep"
+
+_object_getstate = getattr(object, "__getstate__", None)
+
+"""
+Builtin types whose subclasses keep part of their state outside `__dict__`.
+"""
+_BUILTIN_CONTAINERS = (list, dict, set, frozenset, tuple, bytearray, deque)
+
+
+class CloneEngine:
+    """
+    A faster replacement for `copy.deepcopy` on prototype graphs. For every
+    class it builds a copy plan once, from the optional `__clone_plan__`
+    mapping of field name to "immutable" (shared), "shallow" (copied one level)
+    or "deep" (the default), and then clones instances by filling a blank
+    object field by field. Lists, dicts, sets and tuples are copied directly;
+    anything else falls back to `copy.deepcopy`, sharing the same memo, so
+    circular references are preserved either way.
+
+    Classes without a `__clone_plan__` only get a plan when they use the default
+    pickling protocol; custom `__deepcopy__`/`__reduce__` behaviour is kept.
+    No class gets one when its instances keep state outside `__dict__`, i.e. in
+    `__slots__` or in a builtin container base class, nor when they can't be
+    created with a bare `cls.__new__(cls)`.
+    """
+
+    def __init__(self) -> None:
+        self._plans = {}
+
+    def clone(self, obj, memo=None):
+        return self._deep(obj, {} if memo is None else memo)
+
+    def has_plan(self, cls) -> bool:
+        return self._plan_for(cls) is not None
+
+    def _plan_for(self, cls):
+        try:
+            return self._plans[cls]
+        except KeyError:
+            pass
+
+        plan = getattr(cls, "__clone_plan__", None)
+        if (issubclass(cls, _BUILTIN_CONTAINERS) or issubclass(cls, type)
+                or any("__slots__" in vars(base) for base in cls.__mro__)
+                or hasattr(cls, "__getnewargs__") or hasattr(cls, "__getnewargs_ex__")
+                or cls.__new__ is not object.__new__):
+            plan = None
+        elif plan is None and (
+                cls.__reduce_ex__ is object.__reduce_ex__
+                and cls.__reduce__ is object.__reduce__
+                and not hasattr(cls, "__deepcopy__")
+                and not hasattr(cls, "__setstate__")
+                and getattr(cls, "__getstate__", _object_getstate) is _object_getstate):
+            plan = {}
+        self._plans[cls] = plan
+        return plan
+
+    def _deep(self, x, memo):
+        cls = type(x)
+        if cls in _ATOMIC or issubclass(cls, type):
+            return x
+        y = memo.get(id(x), memo)
+        if y is not memo:
+            return y
+
+        deep = self._deep
+        if cls is list:
+            y = []
+            memo[id(x)] = y
+            y.extend([deep(item, memo) for item in x])
+        elif cls is dict:
+            y = {}
+            memo[id(x)] = y
+            for key, value in x.items():
+                y[deep(key, memo)] = deep(value, memo)
+        elif cls is set:
+            y = set()
+            memo[id(x)] = y
+            y.update([deep(item, memo) for item in x])
+        elif cls is tuple or cls is frozenset:
+            items = [deep(item, memo) for item in x]
+            # Un tuple solo puede contenerse a si mismo a traves de un objeto mutable
+            y = memo.get(id(x), memo)
+            if y is memo:
+                same = all(a is b for a, b in zip(items, x))
+                y = x if same else cls(items)
+                memo[id(x)] = y
+        else:
+            plan = self._plan_for(cls)
+            state = getattr(x, "__dict__", None)
+            if plan is None or state is None:
+                return copy.deepcopy(x, memo)
+
+            y = cls.__new__(cls)
+            memo[id(x)] = y
+            new_state = y.__dict__
+            for name, value in state.items():
+                kind = plan.get(name, _DEEP)
+                if kind == _IMMUTABLE or type(value) in _ATOMIC:
+                    new_state[name] = value
+                elif kind == _SHALLOW:
+                    new_state[name] = copy.copy(value)
+                else:
+                    new_state[name] = deep(value, memo)
+        return y
+
+
+clone_engine = CloneEngine()
+
+
+def _instance_fields(obj):
+    """
+    Yields the name and value of every field of `obj`, in `__dict__` and in
+    the `__slots__` of its classes.
+    """
+    yield from getattr(obj, "__dict__", {}).items()
+    for base in type(obj).__mro__:
+        slots = vars(base).get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                yield name, getattr(obj, name)
 
 
 class SelfReferencingEntity:
@@ -17,6 +159,12 @@ class SomeComponent:
     functions.
     """
 
+    __clone_plan__ = {
+        "some_int": _IMMUTABLE,
+        "some_list_of_objects": _DEEP,
+        "some_circular_ref": _DEEP,
+    }
+
     def __init__(self, some_int, some_list_of_objects, some_circular_ref):
         self.some_int = some_int
         self.some_list_of_objects = some_list_of_objects
@@ -42,7 +190,7 @@ class SomeComponent:
 
         return new
 
-    def __deepcopy__(self, memo={}):
+    def __deepcopy__(self, memo=None):
         """
         Create a deep copy. This method will be called whenever someone calls
         `copy.deepcopy` with this object and the returned value is returned as
@@ -52,23 +200,527 @@ class SomeComponent:
         used by the `deepcopy` library to prevent infinite recursive copies in
         instances of circular references. Pass it to all the `deepcopy` calls
         you make in the `__deepcopy__` implementation to prevent infinite
-        recursions.
+        recursions. It defaults to None rather than `{}`: a default dict would
+        be shared by every direct call and keep growing, handing stale copies
+        back.
         """
 
-        # First, let's create copies of the nested objects.
-        some_list_of_objects = copy.deepcopy(self.some_list_of_objects, memo)
-        some_circular_ref = copy.deepcopy(self.some_circular_ref, memo)
+        # The clone engine follows the class's copy plan: every nested object
+        # is copied exactly once and the memo takes care of circular
+        # references.
+        if clone_engine.has_plan(type(self)):
+            return clone_engine.clone(self, memo)
 
-        # Then, let's clone the object itself, using the prepared clones of the
-        # nested objects.
-        new = self.__class__(
-            self.some_int, some_list_of_objects, some_circular_ref
-        )
-        new.__dict__ = copy.deepcopy(self.__dict__, memo)
+        # Subclasses the engine can't plan for (e.g. with `__slots__`) are
+        # copied field by field.
+        memo = {} if memo is None else memo
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        for name, value in list(_instance_fields(self)):
+            object.__setattr__(new, name, copy.deepcopy(value, memo))
+        return new
+
+
+class PrototypeRegistry:
+    """
+    Keeps prototypes by name, each with a bounded pool of ready-made deep
+    clones that a background thread tops up. `spawn()` hands out a pooled clone
+    in O(1) and only clones synchronously when the pool has run dry. Clones
+    reflect the prototype as it was when they were made, so registered
+    prototypes should not be modified afterwards.
+    """
+
+    def __init__(self, pool_size: int = 16) -> None:
+        self._pool_size = pool_size
+        self._prototypes = {}
+        self._pools = {}
+        self._stats = {}
+        self._refill = Event()
+        self._closed = False
+        self._worker = Thread(target=self._refill_loop, name="prototype-refill",
+                              daemon=True)
+        self._worker.start()
+
+    def register(self, name: str, prototype) -> None:
+        """
+        The pool is filled right away, so the first spawns are already hits.
+        """
+        self._prototypes[name] = prototype
+        self._pools[name] = deque(clone_engine.clone(prototype)
+                                  for _ in range(self._pool_size))
+        self._stats[name] = [0, 0]
+
+    def spawn(self, name: str):
+        pool = self._pools[name]
+        stats = self._stats[name]
+        try:
+            instance = pool.popleft()
+            stats[0] += 1
+        except IndexError:
+            # Pool vacio: se clona en el momento
+            instance = clone_engine.clone(self._prototypes[name])
+            stats[1] += 1
+        self._refill.set()
+        return instance
+
+    def _refill_loop(self) -> None:
+        while True:
+            self._refill.wait()
+            self._refill.clear()
+            if self._closed:
+                return
+            for name, pool in list(self._pools.items()):
+                while len(pool) < self._pool_size and not self._closed:
+                    pool.append(clone_engine.clone(self._prototypes[name]))
+
+    def get_stats(self):
+        """
+        Pool hits, synchronous fallbacks (misses), hit rate and current pool
+        size for every prototype.
+        """
+        stats = {}
+        for name, (hits, misses) in self._stats.items():
+            total = hits + misses
+            stats[name] = {"hits": hits, "misses": misses,
+                           "hit_rate": hits / total if total else None,
+                           "pooled": len(self._pools[name])}
+        return stats
+
+    def close(self) -> None:
+        self._closed = True
+        self._refill.set()
+        self._worker.join()
+
+
+def _immutable_parts(prototype) -> dict:
+    """
+    Finds the tuples and frozensets of the prototype that only hold immutable
+    values. Deep copies can share them as they are, so `clone_many` seeds every
+    clone's memo with them instead of walking them again for each copy.
+    """
+    shared = {}
+    seen = set()
+
+    def immutable(x) -> bool:
+        cls = type(x)
+        if cls in _ATOMIC or issubclass(cls, type):
+            return True
+        if id(x) in seen:
+            return id(x) in shared
+        seen.add(id(x))
+        if cls is tuple or cls is frozenset:
+            if all([immutable(item) for item in x]):
+                shared[id(x)] = x
+                return True
+        elif cls is list or cls is set:
+            for item in x:
+                immutable(item)
+        elif cls is dict:
+            for value in x.values():
+                immutable(value)
+        elif hasattr(x, "__dict__"):
+            for value in vars(x).values():
+                immutable(value)
+        return False
+
+    immutable(prototype)
+    return shared
+
+
+_worker_prototype = None
+_worker_shared = None
+_worker_tokens = None
+
+
+def _init_clone_worker(prototype, shared_parts: list) -> None:
+    # prototype y shared_parts llegan en el mismo pickle, así que comparten objetos
+    global _worker_prototype, _worker_shared, _worker_tokens
+    _worker_prototype = prototype
+    _worker_shared = {id(part): part for part in shared_parts}
+    _worker_tokens = {id(part): token for token, part in enumerate(shared_parts)}
+
+
+def _clone_batch(count: int) -> bytes:
+    """
+    Clones a batch in a worker process and pickles it with the shared parts
+    replaced by their position in the parent's list, see `clone_many`.
+    """
+    clones = [clone_engine.clone(_worker_prototype, dict(_worker_shared))
+              for _ in range(count)]
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = lambda obj: _worker_tokens.get(id(obj))
+    pickler.dump(clones)
+    return buffer.getvalue()
+
+
+def _load_batch(data: bytes, shared_parts: list) -> list:
+    unpickler = pickle.Unpickler(io.BytesIO(data))
+    unpickler.persistent_load = shared_parts.__getitem__
+    return unpickler.load()
+
+
+def clone_many(prototype, n: int, workers: int = 0, processes: bool = False) -> list:
+    """
+    Makes `n` independent deep copies of `prototype`. The analysis of which
+    parts are immutable is done once, and those parts are shared by every copy
+    and with the prototype.
+
+    With `workers`, the copies are made in batches on a pool. Threads only run
+    in parallel on a free-threaded Python build; with `processes` each worker
+    receives the prototype once and sends back its batch of clones pickled,
+    with the immutable parts as references, so the clones still share the
+    parent's. The parent unpickles every batch itself, one after another, and
+    that alone costs half to two thirds of a sequential clone, so the process
+    pool is at most about 1.5-2x faster than the sequential path however many
+    cores there are; it only pays off for prototypes whose immutable parts
+    are large.
+    """
+    shared = _immutable_parts(prototype)
+
+    def clone_batch(count: int) -> list:
+        return [clone_engine.clone(prototype, dict(shared)) for _ in range(count)]
+
+    if not workers:
+        return clone_batch(n)
+
+    batches = workers * 4
+    sizes = [n // batches + (1 if i < n % batches else 0) for i in range(batches)]
+    if processes:
+        shared_parts = list(shared.values())
+        with ProcessPoolExecutor(workers, initializer=_init_clone_worker,
+                                 initargs=(prototype, shared_parts)) as pool:
+            return [clone for data in pool.map(_clone_batch, sizes)
+                    for clone in _load_batch(data, shared_parts)]
+    with ThreadPoolExecutor(workers) as pool:
+        return [clone for batch in pool.map(clone_batch, sizes) for clone in batch]
+
+
+class _CowContext:
+    """
+    State shared by all the views of one lazy clone. `memo` maps the id of an
+    original object to its view, so shared and circular references inside the
+    prototype stay shared and circular inside the clone.
+    """
+
+    def __init__(self) -> None:
+        self.memo = {}
+
+    def lazy(self, value):
+        cls = type(value)
+        if cls in _ATOMIC or issubclass(cls, type):
+            return value
+        view = self.memo.get(id(value))
+        if view is not None:
+            return view
+
+        if cls is list:
+            view = CowList(value, self)
+        elif cls is dict:
+            view = CowDict(value, self)
+        elif cls is set:
+            view = CowSet(value, self)
+        elif cls is tuple or cls is frozenset:
+            items = [self.lazy(item) for item in value]
+            view = value if all(a is b for a, b in zip(items, value)) else cls(items)
+        elif hasattr(value, "__dict__") and clone_engine._plan_for(cls) is not None:
+            view = _lazy_instance(value, self)
+        else:
+            return clone_engine.clone(value, self.memo)
+        self.memo[id(value)] = view
+        return view
+
+
+class CowList(MutableSequence):
+    """
+    Copy-on-write view of a list. Reads go to the prototype's list and return
+    views of its items; the first write copies the list (one level, the items
+    stay shared views) and only then applies the change.
+    """
+
+    __slots__ = ("_source", "_owned", "_ctx")
+    __hash__ = None
+
+    def __init__(self, source: list, ctx: _CowContext) -> None:
+        self._source = source
+        self._owned = None
+        self._ctx = ctx
 
+    def _own(self) -> list:
+        if self._owned is None:
+            lazy = self._ctx.lazy
+            self._owned = [lazy(item) for item in self._source]
+        return self._owned
+
+    def __len__(self) -> int:
+        return len(self._source if self._owned is None else self._owned)
+
+    def __getitem__(self, index):
+        if self._owned is not None:
+            return self._owned[index]
+        if isinstance(index, slice):
+            return [self._ctx.lazy(item) for item in self._source[index]]
+        return self._ctx.lazy(self._source[index])
+
+    def __iter__(self):
+        if self._owned is not None:
+            return iter(self._owned)
+        return map(self._ctx.lazy, self._source)
+
+    def __setitem__(self, index, value) -> None:
+        self._own()[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._own()[index]
+
+    def insert(self, index: int, value) -> None:
+        self._own().insert(index, value)
+
+    def append(self, value) -> None:
+        self._own().append(value)
+
+    def sort(self, *args, **kwargs) -> None:
+        self._own().sort(*args, **kwargs)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, CowList)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __deepcopy__(self, memo):
+        new = []
+        memo[id(self)] = new
+        new.extend([copy.deepcopy(item, memo) for item in self])
+        return new
+
+
+class CowDict(MutableMapping):
+    """
+    Copy-on-write view of a dict, following the same rules as CowList.
+    """
+
+    __slots__ = ("_source", "_owned", "_ctx")
+
+    def __init__(self, source: dict, ctx: _CowContext) -> None:
+        self._source = source
+        self._owned = None
+        self._ctx = ctx
+
+    def _own(self) -> dict:
+        if self._owned is None:
+            lazy = self._ctx.lazy
+            self._owned = {key: lazy(value) for key, value in self._source.items()}
+        return self._owned
+
+    def __len__(self) -> int:
+        return len(self._source if self._owned is None else self._owned)
+
+    def __getitem__(self, key):
+        if self._owned is not None:
+            return self._owned[key]
+        return self._ctx.lazy(self._source[key])
+
+    def __iter__(self):
+        return iter(self._source if self._owned is None else self._owned)
+
+    def __setitem__(self, key, value) -> None:
+        self._own()[key] = value
+
+    def __delitem__(self, key) -> None:
+        del self._own()[key]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __deepcopy__(self, memo):
+        new = {}
+        memo[id(self)] = new
+        for key, value in self.items():
+            new[copy.deepcopy(key, memo)] = copy.deepcopy(value, memo)
         return new
 
 
+class CowSet(MutableSet):
+    """
+    Copy-on-write view of a set, following the same rules as CowList.
+    """
+
+    __slots__ = ("_source", "_owned", "_ctx")
+
+    def __init__(self, source: set, ctx: _CowContext) -> None:
+        self._source = source
+        self._owned = None
+        self._ctx = ctx
+
+    def _own(self) -> set:
+        if self._owned is None:
+            self._owned = set(map(self._ctx.lazy, self._source))
+        return self._owned
+
+    def __len__(self) -> int:
+        return len(self._source if self._owned is None else self._owned)
+
+    def __contains__(self, item) -> bool:
+        return item in (self._source if self._owned is None else self._owned)
+
+    def __iter__(self):
+        if self._owned is not None:
+            return iter(self._owned)
+        return map(self._ctx.lazy, self._source)
+
+    def add(self, item) -> None:
+        self._own().add(item)
+
+    def discard(self, item) -> None:
+        self._own().discard(item)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    def __deepcopy__(self, memo):
+        new = set()
+        memo[id(self)] = new
+        new.update(copy.deepcopy(item, memo) for item in self)
+        return new
+
+
+_lazy_classes = {}
+
+
+def _lazy_instance(source, ctx: _CowContext):
+    """
+    Creates the lazy clone of a plain object: an instance of a subclass of its
+    class with an empty `__dict__`. A missing field is looked up on the source
+    and stored as a view on first access, so assigning a field only touches the
+    clone, and methods run on the clone itself.
+    """
+    cls = type(source)
+    lazy_cls = _lazy_classes.get(cls)
+    if lazy_cls is None:
+        def __getattr__(self, name):
+            if name.startswith("_cow_"):
+                raise AttributeError(name)
+            try:
+                value = self._cow_source.__dict__[name]
+            except KeyError:
+                raise AttributeError(name) from None
+            view = self._cow_ctx.lazy(value)
+            self.__dict__[name] = view
+            return view
+
+        def __deepcopy__(self, memo):
+            # Convierte la vista en un objeto normal con su estado actual
+            new = cls.__new__(cls)
+            memo[id(self)] = new
+            state = dict(self._cow_source.__dict__)
+            state.update(self.__dict__)
+            for name in state:
+                new.__dict__[name] = copy.deepcopy(getattr(self, name), memo)
+            return new
+
+        lazy_cls = type(cls.__name__, (cls,), {
+            "__slots__": ("_cow_source", "_cow_ctx"),
+            "__getattr__": __getattr__,
+            "__deepcopy__": __deepcopy__,
+            "__qualname__": cls.__qualname__,
+            "__module__": cls.__module__,
+        })
+        _lazy_classes[cls] = lazy_cls
+
+    instance = lazy_cls.__new__(lazy_cls)
+    object.__setattr__(instance, "_cow_source", source)
+    object.__setattr__(instance, "_cow_ctx", ctx)
+    return instance
+
+
+def lazy_clone(prototype):
+    """
+    Returns a copy-on-write clone that shares the prototype's nested structures
+    until they are written to. `copy.deepcopy(clone)` turns it into a regular,
+    fully independent object. The prototype must not be modified while lazy
+    clones of it are in use, since unwritten parts are read from it.
+    """
+    return _CowContext().lazy(prototype)
+
+
+def benchmark(nodes: int = 100_000) -> None:
+    """
+    Clones a graph of `nodes` entities, each pointing at its parent in a tree
+    and holding nested lists, sets and tuples, with `copy.deepcopy` and with the
+    clone engine.
+    """
+    from time import perf_counter
+
+    graph = []
+    for i in range(nodes):
+        entity = SelfReferencingEntity()
+        entity.set_parent(graph[(i - 1) // 2] if i else None)
+        entity.payload = [i, {i, i + 1}, (i, "tag")]
+        graph.append(entity)
+
+    for name, clone in (("copy.deepcopy", copy.deepcopy),
+                        ("CloneEngine", clone_engine.clone)):
+        start = perf_counter()
+        cloned = clone(graph)
+        elapsed = perf_counter() - start
+        assert cloned[-1].parent is cloned[(nodes - 2) // 2]
+        assert cloned[-1].payload == graph[-1].payload
+        assert cloned[-1].payload[1] is not graph[-1].payload[1]
+        print(f"{name}: {elapsed:.2f}s for {nodes} nodes")
+
+
+def benchmark_lazy(clones: int = 1000, copies: int = 10) -> None:
+    """
+    Clone latency and memory per clone for a SomeComponent holding large
+    nested lists and sets: `copy.deepcopy` versus lazy copy-on-write clones.
+    """
+    from time import perf_counter
+    import tracemalloc
+
+    circular_ref = SelfReferencingEntity()
+    big = [[list(range(1000)), set(range(1000))] for _ in range(100)]
+    component = SomeComponent(23, big, circular_ref)
+    circular_ref.set_parent(component)
+
+    for name, clone, count in (("copy.deepcopy", copy.deepcopy, copies),
+                               ("lazy_clone", lazy_clone, clones)):
+        tracemalloc.start()
+        start = perf_counter()
+        kept = [clone(component) for _ in range(count)]
+        elapsed = perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert kept[-1].some_circular_ref.parent is kept[-1]
+        print(f"{name}: {elapsed / count * 1e6:,.0f} us and "
+              f"{memory / count / 1024:,.1f} KiB per clone")
+        del kept
+
+
+def benchmark_clone_many(n: int = 1000, workers=(0, 2, 4)) -> None:
+    """
+    Times `clone_many` sequentially and on thread and process pools.
+    """
+    from time import perf_counter
+
+    circular_ref = SelfReferencingEntity()
+    items = [[i, (i, "frozen", (1, 2)), {i}] for i in range(500)]
+    component = SomeComponent(23, items, circular_ref)
+    circular_ref.set_parent(component)
+
+    for count in workers:
+        for processes in ((False,) if not count else (False, True)):
+            start = perf_counter()
+            clones = clone_many(component, n, count, processes)
+            elapsed = perf_counter() - start
+            assert clones[-1].some_circular_ref.parent is clones[-1]
+            pool = "sequential" if not count else (
+                f"{count} {'processes' if processes else 'threads'}")
+            print(f"clone_many({n}), {pool}: {elapsed:.2f}s")
+
+
 if __name__ == "__main__":
 
     list_of_objects = [1, {1, 2, 3}, [1, 2, 3]]
@@ -154,5 +806,32 @@ if __name__ == "__main__":
         "^^ This shows that deepcopied objects contain same reference, they "
         "are not cloned repeatedly."
     )
-    
-    
\ No newline at end of file
+
+    # Clon perezoso: comparte las estructuras hasta que se escriben
+    lazy_component = lazy_clone(component)
+    lazy_component.some_list_of_objects.append("lazy object")
+    lazy_component.some_list_of_objects[1].add(99)
+    print(
+        f"Lazy clone wrote to its own list ({lazy_component.some_list_of_objects[-1]!r}) "
+        f"and set ({99 in lazy_component.some_list_of_objects[1]}); the "
+        f"prototype did not change: {'lazy object' not in component.some_list_of_objects} "
+        f"{99 not in component.some_list_of_objects[1]}. Circular reference kept: "
+        f"{lazy_component.some_circular_ref.parent is lazy_component}"
+    )
+
+    # Clones listos de antemano para el camino de las peticiones
+    registry = PrototypeRegistry(pool_size=4)
+    registry.register("component", component)
+    spawned = [registry.spawn("component") for _ in range(6)]
+    print(
+        f"Spawned {len(spawned)} components, the first one has "
+        f"some_int={spawned[0].some_int}; pool stats: "
+        f"{registry.get_stats()['component']}"
+    )
+    registry.close()
+
+    if "--bench" in sys.argv:
+        print("")
+        benchmark()
+        benchmark_lazy()
+        benchmark_clone_many()
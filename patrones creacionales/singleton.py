@@ -1,3 +1,12 @@
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List
+import atexit
+import os
+import sys
+
+
 class SingletonMeta(type):
     """
     The Singleton class can be implemented in different ways in Python. Some
@@ -7,16 +16,206 @@ class SingletonMeta(type):
 
     _instances = {}
 
+    """
+    Seconds spent constructing each class, recorded only on first construction
+    so the lookup path stays as cheap as before.
+    """
+    _construction_times = {}
+
+    """
+    Classes whose instance has been requested again after its construction.
+    """
+    _used = set()
+
     def __call__(cls, *args, **kwargs):
         """
         Possible changes to the value of the `__init__` argument do not affect
         the returned instance.
         """
         if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
+            instance = cls._construct(*args, **kwargs)
             cls._instances[cls] = instance
+        else:
+            SingletonMeta._used.add(cls)
         return cls._instances[cls]
 
+    def _construct(cls, *args, **kwargs):
+        start = perf_counter()
+        instance = super().__call__(*args, **kwargs)
+        SingletonMeta._construction_times[cls] = perf_counter() - start
+        return instance
+
+    @staticmethod
+    def registry_report() -> List[Dict[str, Any]]:
+        """
+        One row per class in `_instances`: how long its construction took and
+        whether it was ever used. A lazy singleton is used once its proxy has
+        been materialized; an eager one once it has been requested again after
+        its construction, so one built at import and never touched again
+        reports False.
+        """
+        report = []
+        for cls, instance in SingletonMeta._instances.items():
+            lazy = isinstance(instance, LazySingletonProxy)
+            report.append({
+                "class": cls.__qualname__,
+                "lazy": lazy,
+                "construction_time": SingletonMeta._construction_times.get(cls),
+                "used": (instance._proxy_target is not None if lazy
+                         else cls in SingletonMeta._used),
+            })
+        return report
+
+
+class ThreadSafeSingletonMeta(SingletonMeta):
+    """
+    The plain SingletonMeta lets two threads race past the `not in` check and
+    both run `__init__`. This variant uses double-checked locking: once the
+    instance exists a single dict lookup returns it without taking any lock, and
+    only the first construction locks, with one lock per class so unrelated
+    singletons never wait on each other.
+    """
+
+    _locks = {}
+    _locks_guard = Lock()
+
+    def __call__(cls, *args, **kwargs):
+        try:
+            instance = cls._instances[cls]
+        except KeyError:
+            pass
+        else:
+            SingletonMeta._used.add(cls)
+            return instance
+
+        with cls._locks_guard:
+            lock = cls._locks.setdefault(cls, Lock())
+        with lock:
+            # Otro hilo pudo crear la instancia mientras se esperaba el lock
+            if cls not in cls._instances:
+                cls._instances[cls] = cls._construct(*args, **kwargs)
+            else:
+                SingletonMeta._used.add(cls)
+        return cls._instances[cls]
+
+
+class LazySingletonProxy:
+    """
+    Stands in for a lazy singleton until it is first used. The real instance is
+    built, and its `__init__` run, on the first attribute access. Implicit
+    special-method lookups (`len(proxy)`, `proxy + 1`...) bypass the proxy, so
+    lazy singletons should be used through regular attributes and methods.
+    """
+
+    __slots__ = ("_proxy_cls", "_proxy_args", "_proxy_kwargs", "_proxy_target",
+                 "_proxy_lock")
+
+    def __init__(self, cls, args, kwargs) -> None:
+        object.__setattr__(self, "_proxy_cls", cls)
+        object.__setattr__(self, "_proxy_args", args)
+        object.__setattr__(self, "_proxy_kwargs", kwargs)
+        object.__setattr__(self, "_proxy_target", None)
+        object.__setattr__(self, "_proxy_lock", Lock())
+
+    def _proxy_resolve(self):
+        target = self._proxy_target
+        if target is None:
+            with self._proxy_lock:
+                target = self._proxy_target
+                if target is None:
+                    target = SingletonMeta._construct(
+                        self._proxy_cls, *self._proxy_args, **self._proxy_kwargs)
+                    object.__setattr__(self, "_proxy_target", target)
+        return target
+
+    @property
+    def __class__(self):
+        # isinstance() sigue funcionando sin construir la instancia real
+        return self._proxy_cls
+
+    def __getattr__(self, name: str):
+        return getattr(self._proxy_resolve(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._proxy_resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._proxy_resolve(), name)
+
+    def __repr__(self) -> str:
+        if self._proxy_target is None:
+            return f"<lazy {self._proxy_cls.__qualname__} singleton (not constructed)>"
+        return repr(self._proxy_target)
+
+
+class LazySingletonMeta(ThreadSafeSingletonMeta):
+    """
+    Deferred initialization: `Singleton()` returns a LazySingletonProxy right
+    away, so declaring or requesting a singleton at import time costs nothing.
+    Any `__init__` arguments are kept for the real construction.
+    """
+
+    def _construct(cls, *args, **kwargs):
+        return LazySingletonProxy(cls, args, kwargs)
+
+
+class ForkAwareSingletonMeta(ThreadSafeSingletonMeta):
+    """
+    Instances are scoped to the process: after `os.fork()` the child forgets
+    the ones it inherited (sockets, locks, threads that no longer exist...) and
+    builds its own on first use.
+    """
+
+
+def _reset_singletons_after_fork() -> None:
+    """
+    Runs in the child right after a fork. The construction locks are replaced as
+    well, since a lock held by another parent thread would never be released.
+    """
+    for cls in list(SingletonMeta._instances):
+        if isinstance(cls, ForkAwareSingletonMeta):
+            del SingletonMeta._instances[cls]
+            SingletonMeta._used.discard(cls)
+    ThreadSafeSingletonMeta._locks = {}
+    ThreadSafeSingletonMeta._locks_guard = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_singletons_after_fork)
+
+
+class SharedMemorySingleton(metaclass=ForkAwareSingletonMeta):
+    """
+    Base class for read-mostly singletons. Subclasses implement `load()`, which
+    runs once per deployment; its bytes go into a shared memory segment and
+    every process, including forked workers that rebuild the singleton, exposes
+    the same pages as a read-only `data` memoryview instead of keeping its own
+    copy.
+    """
+
+    _segments = {}
+
+    def __init__(self) -> None:
+        cls = type(self)
+        if cls not in SharedMemorySingleton._segments:
+            payload = self.load()
+            segment = SharedMemory(create=True, size=max(1, len(payload)))
+            segment.buf[:len(payload)] = payload
+            SharedMemorySingleton._segments[cls] = (segment, len(payload), os.getpid())
+        segment, size, _ = SharedMemorySingleton._segments[cls]
+        self.data = segment.buf[:size].toreadonly()
+
+    def load(self) -> bytes:
+        raise NotImplementedError
+
+
+@atexit.register
+def _release_shared_segments() -> None:
+    # Solo el proceso que creo cada segmento lo elimina
+    for segment, _, owner in SharedMemorySingleton._segments.values():
+        if owner == os.getpid():
+            segment.unlink()
+
 
 class Singleton(metaclass=SingletonMeta):
     def some_business_logic(self):
@@ -27,6 +226,117 @@ class Singleton(metaclass=SingletonMeta):
 
         # ...
 
+
+class ThreadSafeSingleton(metaclass=ThreadSafeSingletonMeta):
+    def some_business_logic(self):
+        # ...
+        pass
+
+
+class LazySingleton(metaclass=LazySingletonMeta):
+    def __init__(self) -> None:
+        print("LazySingleton: running the expensive __init__ now.")
+
+    def some_business_logic(self):
+        # ...
+        return "LazySingleton: doing some business logic."
+
+
+class UnusedLazySingleton(metaclass=LazySingletonMeta):
+    def some_business_logic(self):
+        # ...
+        pass
+
+
+PAYLOAD_SIZE = 64 * 2**20
+
+
+class PrivateLookupTable(metaclass=ForkAwareSingletonMeta):
+    def __init__(self) -> None:
+        self.data = b"x" * PAYLOAD_SIZE
+
+
+class SharedLookupTable(SharedMemorySingleton):
+    def load(self) -> bytes:
+        return b"x" * PAYLOAD_SIZE
+
+
+def _measure_worker(table_cls, barrier, results) -> None:
+    table = table_cls()
+    sum(table.data[::4096]) # se toca cada pagina del payload
+    barrier.wait()
+    with open("/proc/self/smaps_rollup") as rollup:
+        pss = next(int(line.split()[1]) for line in rollup if line.startswith("Pss:"))
+    results.put(pss * 1024)
+    barrier.wait()
+
+
+def benchmark_fork_memory(workers: int = 16) -> None:
+    """
+    Forks `workers` processes that each use a 64 MiB read-mostly singleton and
+    sums their proportional set size (Linux only), once with a private copy
+    per process and once backed by shared memory.
+    """
+    from multiprocessing import get_context
+
+    context = get_context("fork")
+    SharedLookupTable() # el padre carga los datos una sola vez
+    for table_cls in (PrivateLookupTable, SharedLookupTable):
+        barrier = context.Barrier(workers)
+        results = context.Queue()
+        processes = [context.Process(target=_measure_worker,
+                                     args=(table_cls, barrier, results))
+                     for _ in range(workers)]
+        for process in processes:
+            process.start()
+        total = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        print(f"{table_cls.__name__}: {total / 2**20:.0f} MiB PSS across "
+              f"{workers} workers ({PAYLOAD_SIZE // 2**20} MiB payload)")
+
+
+def benchmark(threads: int = 64, calls: int = 20_000) -> None:
+    """
+    Starts `threads` threads at once on a fresh class with a slow `__init__`,
+    counting how many times it runs, and then measures the steady-state cost of
+    `calls` lookups per thread for both metaclasses.
+    """
+    from threading import Barrier, Thread
+    from time import perf_counter, sleep
+
+    def run(target) -> float:
+        barrier = Barrier(threads + 1)
+
+        def worker():
+            barrier.wait()
+            for _ in range(calls):
+                target()
+
+        workers = [Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        start = perf_counter()
+        barrier.wait()
+        for thread in workers:
+            thread.join()
+        return perf_counter() - start
+
+    for metaclass in (SingletonMeta, ThreadSafeSingletonMeta):
+        constructions = []
+
+        def __init__(self):
+            sleep(0.01) # un __init__ costoso amplia la ventana de carrera
+            constructions.append(self)
+
+        slow = metaclass("Slow", (), {"__init__": __init__})
+        run(slow)
+        elapsed = run(slow)
+        print(f"{metaclass.__name__}: __init__ ran {len(constructions)} time(s), "
+              f"steady state {elapsed / (threads * calls) * 1e9:.0f} ns/call "
+              f"with {threads} threads")
+
+
 if __name__ == "__main__":
     # The client code.
 
@@ -37,4 +347,26 @@ if __name__ == "__main__":
         print("Singleton works, both variables contain the same instance.")
     else:
         print("Singleton failed, variables contain different instances.")
-        
\ No newline at end of file
+
+    s3 = ThreadSafeSingleton()
+    s4 = ThreadSafeSingleton()
+
+    if id(s3) == id(s4):
+        print("ThreadSafeSingleton works, both variables contain the same instance.")
+    else:
+        print("ThreadSafeSingleton failed, variables contain different instances.")
+
+    s5 = LazySingleton()
+    UnusedLazySingleton()
+    print(f"Client: Got {s5!r}")
+    print(s5.some_business_logic())
+
+    print("\nSingleton registry:")
+    for row in SingletonMeta.registry_report():
+        time = row["construction_time"]
+        print(f"  {row['class']}: lazy={row['lazy']} used={row['used']} "
+              f"construction={'-' if time is None else f'{time * 1e6:.0f} us'}")
+
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_fork_memory()
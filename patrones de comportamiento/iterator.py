@@ -1,6 +1,18 @@
 from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
 from collections.abc import Iterable, Iterator
-from typing import Any, List
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from itertools import accumulate, islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, List, Optional, Union
+import os
+import shutil
+import sys
+import tempfile
+import weakref
 
 
 """
@@ -32,10 +44,23 @@ class AlphabeticalOrderIterator(Iterator):
     """
     _reverse: bool = False
 #inicia las variables collection, reverse y position
-    def __init__(self, collection: WordsCollection, reverse: bool = False) -> None:
+    def __init__(self, collection: WordsCollection, reverse: bool = False,
+                 start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        `start` and `stop` restrict the traversal to a range of positions. With
+        no `stop`, a forward iterator also sees items added while it runs.
+        """
         self._collection = collection
         self._reverse = reverse
-        self._position = -1 if reverse else 0
+        self._start = start
+        self._stop = stop
+        if reverse:
+            self._position = (len(collection) if stop is None else stop) - 1
+        else:
+            self._position = start
+
+    def _end(self) -> int:
+        return len(self._collection) if self._stop is None else self._stop
 
     def __next__(self):
         """
@@ -44,16 +69,41 @@ class AlphabeticalOrderIterator(Iterator):
         """
         '''
         next debe retornar el siguiente item consecuentemente, si es el ultimo
-        debe detener la iteración y para eso es utilizado el manejo de errores
-        try/catch 
+        debe detener la iteración comparando la posicion con los limites del
+        rango
         '''
-        try:
-            value = self._collection[self._position]
-            self._position += -1 if self._reverse else 1
-        except IndexError:
-            raise StopIteration()
+        position = self._position
+        if self._reverse:
+            if position < self._start:
+                raise StopIteration()
+            self._position = position - 1
+        else:
+            if position >= self._end():
+                raise StopIteration()
+            self._position = position + 1
 
-        return value
+        return self._collection[position]
+
+    def iter_chunks(self, size: int) -> Iterator[List[Any]]:
+        """
+        Yields the remaining items as lists of up to `size` items, slicing the
+        underlying storage instead of stepping one item at a time.
+        """
+        while True:
+            if self._reverse:
+                low = max(self._start, self._position - size + 1)
+                if self._position < low:
+                    return
+                chunk = list(self._collection[low:self._position + 1])
+                chunk.reverse()
+                self._position = low - 1
+            else:
+                high = min(self._position + size, self._end())
+                if self._position >= high:
+                    return
+                chunk = list(self._collection[self._position:high])
+                self._position = high
+            yield chunk
 
 
 class WordsCollection(Iterable):
@@ -62,8 +112,12 @@ class WordsCollection(Iterable):
     iterator instances, compatible with the collection class.
     """
 
-    def __init__(self, collection: List[Any] = []) -> None:
-        self._collection = collection
+    def __init__(self, collection: Optional[List[Any]] = None) -> None:
+        # Cada coleccion recibe su propia lista; un [] por defecto seria compartido
+        self._collection = [] if collection is None else collection
+
+    def __len__(self) -> int:
+        return len(self._collection)
 
     def __iter__(self) -> AlphabeticalOrderIterator:
         """
@@ -78,6 +132,605 @@ class WordsCollection(Iterable):
     def add_item(self, item: Any): #agregará los elementos en la posción corresponiente
         self._collection.append(item)
 
+    def iter_chunks(self, size: int, reverse: bool = False) -> Iterator[List[Any]]:
+        iterator = self.get_reverse_iterator() if reverse else iter(self)
+        return iterator.iter_chunks(size)
+
+    def split(self, n: int, reverse: bool = False) -> List[AlphabeticalOrderIterator]:
+        """
+        Hands out `n` iterators over disjoint, contiguous ranges of the
+        collection. Consuming them one after another gives the same order as
+        `__iter__` (or `get_reverse_iterator` with `reverse`).
+        """
+        size = len(self._collection)
+        bounds = [size * i // n for i in range(n + 1)]
+        ranges = list(zip(bounds, bounds[1:]))
+        if reverse:
+            ranges.reverse()
+        return [AlphabeticalOrderIterator(self._collection, reverse, low, high)
+                for low, high in ranges]
+
+    def parallel_map(self, fn: Callable[[str], Any], workers: Optional[int] = None,
+                     reverse: bool = False, chunk_size: int = 65536) -> List[Any]:
+        """
+        Applies `fn` to every word on a process pool and returns the results in
+        traversal order. Each worker gets one range from `split()`, packed into
+        a shared memory segment, so words are not pickled one by one. `fn` must
+        be picklable (a module-level function).
+        """
+        workers = workers or os.cpu_count() or 1
+        segments = []
+        try:
+            for part in self.split(workers, reverse):
+                words = [word for chunk in part.iter_chunks(chunk_size) for word in chunk]
+                segments.append((_pack_shared(words), len(words)))
+
+            with ProcessPoolExecutor(workers) as pool:
+                futures = [pool.submit(_map_shared_chunk, segment.name, count, fn)
+                           for segment, count in segments]
+                results = []
+                for future in futures: #se unen en el orden de split()
+                    results.extend(future.result())
+            return results
+        finally:
+            for segment, _ in segments:
+                segment.close()
+                segment.unlink()
+
+
+def _encode_word(word: Any) -> bytes:
+    """
+    Words are str, or buffers (bytes, memoryview...) holding UTF-8 text.
+    """
+    if isinstance(word, str):
+        return word.encode("utf-8")
+    try:
+        return memoryview(word).tobytes()
+    except TypeError:
+        raise TypeError(f"parallel_map needs str or buffer words, "
+                        f"not {type(word).__name__}") from None
+
+
+def _pack_shared(words: List[Any]) -> SharedMemory:
+    """
+    Lays a chunk out in shared memory as an array of end offsets followed by
+    the UTF-8 bytes of the words.
+    """
+    encoded = [_encode_word(word) for word in words]
+    offsets = array("Q", [0])
+    offsets.extend(accumulate(len(word) for word in encoded))
+    header = offsets.tobytes()
+    data = b"".join(encoded)
+
+    segment = SharedMemory(create=True, size=max(1, len(header) + len(data)))
+    segment.buf[:len(header)] = header
+    segment.buf[len(header):len(header) + len(data)] = data
+    return segment
+
+
+def _map_shared_chunk(name: str, count: int, fn: Callable[[str], Any]) -> List[Any]:
+    """
+    Runs in a worker process: reads one chunk written by `_pack_shared`.
+    """
+    segment = SharedMemory(name=name)
+    try:
+        header = 8 * (count + 1)
+        offsets = array("Q")
+        offsets.frombytes(segment.buf[:header])
+        data = bytes(segment.buf[header:header + offsets[-1]])
+    finally:
+        segment.close()
+    return [fn(data[offsets[i]:offsets[i + 1]].decode("utf-8")) for i in range(count)]
+
+
+class PackedWords():
+    """
+    Stores words back to back in a single UTF-8 buffer, with an array of end
+    offsets to find each one. That costs the encoded bytes plus 8 bytes per word
+    instead of a full `str` object and a list slot. Words are only decoded when
+    they are read, or handed out as `memoryview` slices with `as_memoryview`
+    (release those views before adding more words, the buffer can't grow while
+    they are alive).
+    """
+
+    def __init__(self, words: Iterable[str] = (), as_memoryview: bool = False) -> None:
+        self._buffer = bytearray()
+        self._offsets = array("Q", [0])
+        self._as_memoryview = as_memoryview
+        for word in words:
+            self.append(word)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, memoryview, List]:
+        """
+        Supports negative indexes and raises IndexError past either end, which
+        is all AlphabeticalOrderIterator relies on. A slice decodes its whole
+        run of words in one go.
+        """
+        size = len(self._offsets) - 1
+        if isinstance(index, slice):
+            low, high, _ = index.indices(size)
+            high = max(low, high)
+            base = self._offsets[low]
+            ends = self._offsets[low:high + 1]
+            if self._as_memoryview:
+                view = memoryview(self._buffer)
+                return [view[ends[i]:ends[i + 1]] for i in range(high - low)]
+            data = self._buffer[base:ends[-1]]
+            if data.isascii():
+                # En ASCII los offsets en bytes coinciden con los de caracteres
+                text = data.decode("ascii")
+                return [text[ends[i] - base:ends[i + 1] - base] for i in range(high - low)]
+            return [data[ends[i] - base:ends[i + 1] - base].decode("utf-8")
+                    for i in range(high - low)]
+
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("word index out of range")
+
+        start, end = self._offsets[index], self._offsets[index + 1]
+        if self._as_memoryview:
+            return memoryview(self._buffer)[start:end]
+        return self._buffer[start:end].decode("utf-8")
+
+    def append(self, word: str) -> None:
+        self._buffer += word.encode("utf-8")
+        self._offsets.append(len(self._buffer))
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._buffer) + sys.getsizeof(self._offsets)
+
+
+class CompactWordsCollection(WordsCollection):
+    """
+    A WordsCollection backed by PackedWords. It keeps the same iterators, which
+    decode one word per step.
+    """
+
+    def __init__(self, collection: Iterable[str] = (), as_memoryview: bool = False) -> None:
+        self._collection = PackedWords(collection, as_memoryview)
+
+
+class BlockedSortedList():
+    """
+    Sorted storage made of a list of small sorted blocks. Inserting bisects the
+    per-block maximums and then the target block, so it costs O(log n) plus a
+    bounded shift inside one block instead of re-sorting everything.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), load: int = 1000) -> None:
+        self._load = load
+        self._blocks: List[List[Any]] = []
+        self._maxes: List[Any] = []
+        ordered = sorted(items)
+        for start in range(0, len(ordered), load):
+            block = ordered[start:start + load]
+            self._blocks.append(block)
+            self._maxes.append(block[-1])
+        self._len = len(ordered)
+        self._starts: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Positional access, so the collection can also be split into ranges.
+        Block start positions are cached until the next `add()`.
+        """
+        if self._starts is None:
+            self._starts = [0, *accumulate(len(block) for block in self._blocks)]
+        if isinstance(index, slice):
+            low, high, _ = index.indices(self._len)
+            items = []
+            block = bisect_right(self._starts, low) - 1
+            while low < high:
+                offset = low - self._starts[block]
+                taken = self._blocks[block][offset:offset + high - low]
+                items.extend(taken)
+                low += len(taken)
+                block += 1
+            return items
+
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("index out of range")
+        block = bisect_right(self._starts, index) - 1
+        return self._blocks[block][index - self._starts[block]]
+
+    def add(self, item: Any) -> None:
+        self._len += 1
+        self._starts = None
+        if not self._blocks:
+            self._blocks.append([item])
+            self._maxes.append(item)
+            return
+
+        index = bisect_left(self._maxes, item)
+        if index == len(self._blocks):
+            # Mayor que todo lo almacenado: va al final del ultimo bloque
+            index -= 1
+            self._blocks[index].append(item)
+            self._maxes[index] = item
+        else:
+            insort(self._blocks[index], item)
+
+        block = self._blocks[index]
+        if len(block) > 2 * self._load:
+            # Se parte el bloque para que las inserciones sigan siendo baratas
+            self._blocks.insert(index + 1, block[self._load:])
+            del block[self._load:]
+            self._maxes[index] = block[-1]
+            self._maxes.insert(index + 1, self._blocks[index + 1][-1])
+
+    def blocks(self) -> List[List[Any]]:
+        return self._blocks
+
+
+class SortedOrderIterator(Iterator):
+    """
+    Streams a BlockedSortedList in order (or in reverse) one block at a time,
+    so the first word is available immediately. Adding items while iterating
+    is not supported, just as with the built-in containers.
+    """
+
+    def __init__(self, storage: BlockedSortedList, reverse: bool = False) -> None:
+        self._blocks = storage.blocks()
+        self._reverse = reverse
+        self._block = len(self._blocks) - 1 if reverse else 0
+        self._current = iter(())
+
+    def __next__(self):
+        while True:
+            for value in self._current:
+                return value
+            if not 0 <= self._block < len(self._blocks):
+                raise StopIteration()
+
+            block = self._blocks[self._block]
+            self._current = reversed(block) if self._reverse else iter(block)
+            self._block += -1 if self._reverse else 1
+
+    def iter_chunks(self, size: int) -> Iterator[List[Any]]:
+        while True:
+            chunk = list(islice(self, size))
+            if not chunk:
+                return
+            yield chunk
+
+
+class SortedWordsCollection(WordsCollection):
+    """
+    A WordsCollection that really is traversed in alphabetical order. Items are
+    kept sorted as they are added, so iterating never has to sort.
+    """
+
+    def __init__(self, collection: Iterable[Any] = ()) -> None:
+        self._collection = BlockedSortedList(collection)
+
+    def __iter__(self) -> SortedOrderIterator:
+        return SortedOrderIterator(self._collection)
+
+    def get_reverse_iterator(self) -> SortedOrderIterator:
+        return SortedOrderIterator(self._collection, True)
+
+    def add_item(self, item: Any):
+        self._collection.add(item)
+
+
+def _read_run(path: str) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8", newline="\n", buffering=1 << 16) as run:
+        for line in run:
+            yield line[:-1]
+
+
+def _read_run_reversed(path: str, block_size: int = 1 << 16) -> Iterator[str]:
+    """
+    Reads a run file from the end, one block at a time, yielding its lines last
+    to first.
+    """
+    with open(path, "rb") as run:
+        position = run.seek(0, os.SEEK_END)
+        remainder = b""
+        last_block = True
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            run.seek(position)
+            lines = (run.read(step) + remainder).split(b"\n")
+            if last_block:
+                lines.pop() #el archivo termina en salto de linea
+                last_block = False
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.decode("utf-8")
+        if not last_block:
+            yield remainder.decode("utf-8")
+
+
+class MergedRunsIterator(Iterator):
+    """
+    k-way heap merge over sorted runs. Only the current head of every run is
+    held in memory. With `start`/`stop` only that range of the merged order is
+    returned (the words before `start` are still merged, then skipped).
+    """
+
+    def __init__(self, runs: List[Iterator[str]], reverse: bool = False,
+                 start: int = 0, stop: Optional[int] = None) -> None:
+        self._runs = runs
+        self._merged = islice(merge(*runs, reverse=reverse), start, stop)
+
+    def __next__(self):
+        try:
+            return next(self._merged)
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """
+        Closes the run files early when the traversal is abandoned.
+        """
+        for run in self._runs:
+            if hasattr(run, "close"):
+                run.close()
+
+    def iter_chunks(self, size: int) -> Iterator[List[str]]:
+        while True:
+            chunk = list(islice(self, size))
+            if not chunk:
+                return
+            yield chunk
+
+
+class ExternalWordsCollection(WordsCollection):
+    """
+    A WordsCollection for word sets larger than RAM. `add_item` buffers up to
+    `run_size` words; a full buffer is sorted and spilled to a run file on disk.
+    Iterating merges the runs and the current buffer, so memory stays bounded by
+    `run_size` plus one line per run. Once `max_runs` files pile up they are
+    merged into a single run to keep the number of open files in check.
+
+    Words must not contain newlines, which delimit them in the run files.
+    """
+
+    def __init__(self, collection: Iterable[str] = (), run_size: int = 1_000_000,
+                 max_runs: int = 256, directory: Optional[str] = None) -> None:
+        if max_runs < 2:
+            raise ValueError("max_runs must be at least 2")
+        self._buffer: List[str] = []
+        self._runs: List[str] = []
+        self._spilled = 0
+        self._run_size = run_size
+        self._max_runs = max_runs
+        self._len = 0
+        self._directory = tempfile.mkdtemp(prefix="words-", dir=directory)
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self._directory, True)
+        for word in collection:
+            self.add_item(word)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> MergedRunsIterator:
+        return self._merged()
+
+    def get_reverse_iterator(self) -> MergedRunsIterator:
+        return self._merged(True)
+
+    def _merged(self, reverse: bool = False, start: int = 0,
+                stop: Optional[int] = None) -> MergedRunsIterator:
+        self._buffer.sort()
+        if reverse:
+            runs = [_read_run_reversed(path) for path in self._runs]
+            runs.append(reversed(self._buffer))
+        else:
+            runs = [_read_run(path) for path in self._runs]
+            runs.append(iter(self._buffer))
+        return MergedRunsIterator(runs, reverse, start, stop)
+
+    def add_item(self, item: str):
+        self._buffer.append(item)
+        self._len += 1
+        if len(self._buffer) >= self._run_size:
+            self._buffer.sort()
+            self._spill(iter(self._buffer))
+            self._buffer = []
+
+    def split(self, n: int, reverse: bool = False) -> List[MergedRunsIterator]:
+        """
+        Hands out `n` merged iterators over disjoint, contiguous ranges of the
+        sorted words, as `WordsCollection.split` does. Each one merges the runs
+        on its own and skips to its range, so `parallel_map` streams chunks
+        from a single merge instead.
+        """
+        bounds = [self._len * i // n for i in range(n + 1)]
+        return [self._merged(reverse, low, high) for low, high in zip(bounds, bounds[1:])]
+
+    def parallel_map(self, fn: Callable[[str], Any], workers: Optional[int] = None,
+                     reverse: bool = False, chunk_size: int = 65536) -> List[Any]:
+        """
+        Applies `fn` to every word on a process pool and returns the results in
+        traversal order. The merged words are streamed in chunks of
+        `chunk_size`, each packed into shared memory, and at most two chunks
+        per worker are in flight, so memory stays bounded apart from the
+        results.
+        """
+        workers = workers or os.cpu_count() or 1
+        pending = deque()
+        results = []
+
+        def collect() -> None:
+            future, segment = pending.popleft()
+            try:
+                results.extend(future.result())
+            finally:
+                segment.close()
+                segment.unlink()
+
+        try:
+            with ProcessPoolExecutor(workers) as pool:
+                for chunk in self.iter_chunks(chunk_size, reverse):
+                    if len(pending) >= 2 * workers:
+                        collect()
+                    segment = _pack_shared(chunk)
+                    pending.append((pool.submit(_map_shared_chunk, segment.name,
+                                                len(chunk), fn), segment))
+                while pending:
+                    collect()
+            return results
+        finally:
+            for _, segment in pending:
+                segment.close()
+                segment.unlink()
+
+    def _spill(self, words: Iterator[str]) -> None:
+        self._runs.append(self._write_run(words))
+        if len(self._runs) >= self._max_runs:
+            self._compact()
+
+    def _write_run(self, words: Iterator[str]) -> str:
+        path = os.path.join(self._directory, f"run-{self._spilled:06d}.txt")
+        self._spilled += 1
+        with open(path, "w", encoding="utf-8", newline="\n", buffering=1 << 16) as run:
+            run.writelines(word + "\n" for word in words)
+        return path
+
+    def _compact(self) -> None:
+        """
+        Merges all the run files into a single one.
+        """
+        runs = self._runs
+        self._runs = [self._write_run(merge(*(_read_run(path) for path in runs)))]
+        for path in runs:
+            os.remove(path)
+
+    def close(self) -> None:
+        """
+        Deletes the run files.
+        """
+        self._cleanup()
+
+
+def benchmark(n: int = 1_000_000, rounds: int = 20) -> None:
+    """
+    Grows a collection to `n` random words, adding a batch and reading the first
+    ten words in order `rounds` times, with a plain list that is sorted on every
+    iteration versus the SortedWordsCollection.
+    """
+    from itertools import islice
+    from random import choices
+    from string import ascii_lowercase
+    from time import perf_counter
+
+    words = ["".join(choices(ascii_lowercase, k=8)) for _ in range(n)]
+    batch = n // rounds
+
+    start = perf_counter()
+    plain = []
+    heads = []
+    for r in range(rounds):
+        plain.extend(words[r * batch:(r + 1) * batch])
+        heads.append(list(islice(iter(sorted(plain)), 10)))
+    baseline = perf_counter() - start
+
+    start = perf_counter()
+    collection = SortedWordsCollection()
+    for r in range(rounds):
+        for word in words[r * batch:(r + 1) * batch]:
+            collection.add_item(word)
+        assert list(islice(iter(collection), 10)) == heads[r]
+    blocked = perf_counter() - start
+
+    start = perf_counter()
+    full = sum(1 for _ in collection)
+    streamed = perf_counter() - start
+
+    print(f"{n} words, {rounds} add/iterate rounds:")
+    print(f"  sorted() per iteration: {baseline:.2f}s")
+    print(f"  SortedWordsCollection:  {blocked:.2f}s")
+    print(f"  full sorted traversal of {full} words: {streamed:.2f}s")
+
+
+def benchmark_memory(n: int = 10_000_000) -> None:
+    """
+    Compares the memory held by a list of `n` short words with the same words
+    in a CompactWordsCollection.
+    """
+    from time import perf_counter
+
+    words = [f"word{i:08d}"[:4 + i % 9] for i in range(n)]
+    as_list = sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+
+    compact = CompactWordsCollection(words)
+    packed = compact._collection.nbytes()
+
+    start = perf_counter()
+    count = sum(1 for _ in compact)
+    traversal = perf_counter() - start
+
+    print(f"{n} words:")
+    print(f"  list of str:            {as_list / 2**20:.0f} MiB ({as_list / n:.1f} B/word)")
+    print(f"  CompactWordsCollection: {packed / 2**20:.0f} MiB ({packed / n:.1f} B/word)")
+    print(f"  compact traversal of {count} words: {traversal:.2f}s")
+
+
+def benchmark_external(path: Optional[str] = None, size_gb: float = 2.0,
+                       memory_mb: int = 256) -> None:
+    """
+    Sorts and iterates a word file (one word per line) through an
+    ExternalWordsCollection whose run size is derived from `memory_mb`. Without
+    `path`, a random file of `size_gb` is generated first.
+    """
+    from random import choices
+    from string import ascii_lowercase
+    from time import perf_counter
+    import resource
+
+    owned = path is None
+    if owned:
+        handle, path = tempfile.mkstemp(suffix=".txt")
+        target = int(size_gb * 2**30)
+        with os.fdopen(handle, "w") as out:
+            written = 0
+            while written < target:
+                lines = "".join("".join(choices(ascii_lowercase, k=9)) + "\n"
+                                for _ in range(100_000))
+                out.write(lines)
+                written += len(lines)
+
+    size = os.path.getsize(path)
+    # ~100 bytes por palabra en memoria (str + slot de la lista + sort)
+    run_size = memory_mb * 2**20 // 100
+    try:
+        start = perf_counter()
+        collection = ExternalWordsCollection(run_size=run_size)
+        for word in _read_run(path):
+            collection.add_item(word)
+        ingest = perf_counter() - start
+
+        start = perf_counter()
+        previous, count = "", 0
+        for word in collection:
+            assert previous <= word
+            previous, count = word, count + 1
+        traversal = perf_counter() - start
+        collection.close()
+    finally:
+        if owned:
+            os.remove(path)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{size / 2**30:.2f} GiB, {count} words, "
+          f"{memory_mb} MiB budget ({run_size} words per run):")
+    print(f"  ingest and spill: {ingest:.1f}s")
+    print(f"  merged traversal: {traversal:.1f}s")
+    print(f"  peak RSS:         {peak:.0f} MiB")
+
 
 if __name__ == "__main__":
     # The client code may or may not know about the Concrete Iterator or
@@ -97,4 +750,46 @@ if __name__ == "__main__":
 
     print("Reverse traversal:") #Imrpimirá los elementos en orden descendente
     print("\n".join(collection.get_reverse_iterator()), end="")
+    print("\n")
+
+    '''
+    SortedWordsCollection mantiene los elementos en orden alfabetico
+    '''
+    collection = SortedWordsCollection()
+    collection.add_item("Second")
+    collection.add_item("Third")
+    collection.add_item("First")
+
+    print("Alphabetical traversal:")
+    print("\n".join(collection))
+    print("")
+
+    print("Reverse alphabetical traversal:")
+    print("\n".join(collection.get_reverse_iterator()), end="")
+    print("\n")
+
+    '''
+    Recorrido por bloques y en paralelo sobre rangos disjuntos
+    '''
+    for word in ["Fourth", "Fifth", "Sixth"]:
+        collection.add_item(word)
+    print(f"Chunks of 4: {list(collection.iter_chunks(4))}")
+    print(f"Reverse chunks of 4: {list(collection.iter_chunks(4, reverse=True))}")
+    print(f"Split in 2: {[list(part) for part in collection.split(2)]}")
+    print(f"Parallel map: {collection.parallel_map(str.upper, 2)}")
+    print("")
+
+    '''
+    ExternalWordsCollection vuelca los elementos a disco y los mezcla al recorrer
+    '''
+    collection = ExternalWordsCollection(["Second", "Third", "First", "Fourth"], run_size=2)
+    print(f"External merge traversal: {list(collection)}")
+    print(f"External reverse traversal: {list(collection.get_reverse_iterator())}", end="")
+    collection.close()
+
+    if "--bench" in sys.argv:
+        print("\n")
+        benchmark()
+        benchmark_memory()
+        benchmark_external()
     
\ No newline at end of file
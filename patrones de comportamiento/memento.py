@@ -1,8 +1,16 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from random import sample
 from string import ascii_letters, digits
+from collections import deque
+from threading import BoundedSemaphore, Lock
+from time import time
+from typing import Callable, Dict, Optional, Sequence, Tuple
+import pickle
+import sys
+import zlib
 
 
 class Originator():
@@ -70,6 +78,13 @@ class Memento(ABC):
     def get_date(self) -> str:
         pass
 
+    def get_size(self) -> int:
+        """
+        Approximate memory footprint in bytes, used by the Caretaker to
+        enforce its retention limits.
+        """
+        return sys.getsizeof(self)
+
 
 class ConcreteMemento(Memento):
     def __init__(self, state: str) -> None:
@@ -92,6 +107,62 @@ class ConcreteMemento(Memento):
     def get_date(self) -> str:
         return self._date
 
+    def get_size(self) -> int:
+        return (sys.getsizeof(self) + sys.getsizeof(self._state)
+                + sys.getsizeof(self._date))
+
+
+class CompressedMemento(Memento):
+    """
+    A checkpointed memento: the state is pickled and compressed so it can be
+    kept in memory cheaply or written out to durable storage.
+    """
+
+    def __init__(self, memento: ConcreteMemento, level: int = 6) -> None:
+        self._name = memento.get_name()
+        self._date = memento.get_date()
+        self._payload = zlib.compress(pickle.dumps(memento.get_state()), level)
+
+    def get_state(self) -> str:
+        return pickle.loads(zlib.decompress(self._payload))
+
+    def get_payload(self) -> bytes:
+        return self._payload
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_date(self) -> str:
+        return self._date
+
+    def get_size(self) -> int:
+        return (sys.getsizeof(self) + sys.getsizeof(self._payload)
+                + sys.getsizeof(self._name) + sys.getsizeof(self._date))
+
+
+class _HistoryEntry():
+    """
+    Bookkeeping the Caretaker keeps next to every memento in its history,
+    including its background checkpoint, if any.
+    """
+
+    __slots__ = ("memento", "checkpoint", "created", "size", "live")
+
+    def __init__(self, memento: Memento, created: float, size: int) -> None:
+        self.memento = memento
+        self.checkpoint = None
+        self.created = created
+        self.size = size
+        self.live = True
+
+
+"""
+Default thinning schedule as (max age, interval) pairs in seconds: keep every
+save from the last minute, one per minute for the last hour and one per hour
+for the last day. Older saves are dropped.
+"""
+DEFAULT_THINNING = ((60, 0), (3600, 60), (86400, 3600))
+
 
 class Caretaker():
     """
@@ -100,29 +171,181 @@ class Caretaker():
     works with all mementos via the base Memento interface.
     """
 
-    def __init__(self, originator: Originator) -> None:
-        self._mementos = [] #se declara el estado original
+    def __init__(self, originator: Originator, async_checkpoints: bool = False,
+                 max_in_flight: int = 4,
+                 sink: Optional[Callable[[str, bytes], None]] = None,
+                 max_count: Optional[int] = None,
+                 max_bytes: Optional[int] = None,
+                 thinning: Optional[Sequence[Tuple[float, float]]] = None,
+                 clock: Callable[[], float] = time) -> None:
+        """
+        With `async_checkpoints` enabled, `backup()` only takes the memento
+        (a cheap, consistent view of the state) and a background worker
+        compresses it and hands it to `sink`. At most `max_in_flight`
+        checkpoints may be pending; further backups wait for a free slot. The
+        history keeps the in-memory memento until its checkpoint succeeds, so
+        a failing sink is reported (see `get_stats()`) but loses nothing.
+
+        Retention is unbounded unless configured: `max_count` and `max_bytes`
+        evict the oldest mementos first, and `thinning` is a schedule of
+        (max age, interval) pairs such as `DEFAULT_THINNING`.
+        """
+        self._mementos = deque() #se declara el estado original
         self._originator = originator
+        self._sink = sink
+        self._max_count = max_count
+        self._max_bytes = max_bytes
+        self._thinning = sorted(thinning) if thinning else None
+        self._clock = clock
+        self._bytes = 0
+        self._evictions = {"max_count": 0, "max_bytes": 0, "thinning": 0}
+        self._checkpoint_errors = 0
+        self._lock = Lock()
+        self._executor = None
+        self._last_checkpoint = None
+        if async_checkpoints:
+            # Un solo worker conserva el orden de escritura de los checkpoints
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="caretaker-checkpoint")
+            self._in_flight = BoundedSemaphore(max_in_flight)
 
     def backup(self) -> None: #guarda el estado actual
         print("\nCaretaker: Saving Originator's state...")
-        self._mementos.append(self._originator.save())
-
-    def undo(self) -> None:
-        if not len(self._mementos):
+        memento = self._originator.save()
+        entry = _HistoryEntry(memento, self._clock(), memento.get_size())
+        if self._executor is not None:
+            self._in_flight.acquire()
+
+        # La entrada se contabiliza antes de lanzar el checkpoint, así su
+        # callback siempre corrige un tamaño ya sumado
+        with self._lock:
+            self._mementos.append(entry)
+            self._bytes += entry.size
+            self._enforce_retention()
+
+        if self._executor is not None:
+            entry.checkpoint = self._executor.submit(self._checkpoint, memento)
+            self._last_checkpoint = entry.checkpoint
+            entry.checkpoint.add_done_callback(
+                lambda future: self._on_checkpoint_done(entry, future))
+
+    def _on_checkpoint_done(self, entry: _HistoryEntry, future: Future) -> None:
+        """
+        Once written, the compressed checkpoint replaces the in-memory memento
+        and its real size replaces the estimate. If it failed, the in-memory
+        memento stays and the error is reported.
+        """
+        self._in_flight.release()
+        error = future.exception()
+        if error is not None:
+            with self._lock:
+                self._checkpoint_errors += 1
+            print(f"Caretaker: Checkpoint of {entry.memento.get_name()} failed: "
+                  f"{error!r}; keeping it in memory")
             return
+        with self._lock:
+            checkpoint = future.result()
+            size = checkpoint.get_size()
+            if entry.live:
+                self._bytes += size - entry.size
+            entry.size = size
+            entry.memento = checkpoint
+
+    def _enforce_retention(self) -> None:
+        if self._thinning is not None:
+            self._thin()
+        while self._max_count is not None and len(self._mementos) > self._max_count:
+            self._evict("max_count")
+        while (self._max_bytes is not None and self._bytes > self._max_bytes
+               and len(self._mementos) > 1):
+            self._evict("max_bytes")
+
+    def _evict(self, reason: str) -> None:
+        entry = self._mementos.popleft() #se descarta el memento mas antiguo
+        entry.live = False
+        self._bytes -= entry.size
+        self._evictions[reason] += 1
+
+    def _thin(self) -> None:
+        """
+        Walks the history from newest to oldest and keeps, for every tier of the
+        schedule, only the newest memento in each interval-sized bucket.
+        """
+        now = self._clock()
+        kept = deque()
+        seen = set()
+        for entry in reversed(self._mementos):
+            age = now - entry.created
+            tier = next((i for i, (max_age, _) in enumerate(self._thinning)
+                         if age <= max_age), None)
+            if tier is not None:
+                interval = self._thinning[tier][1]
+                bucket = (tier, int(entry.created // interval) if interval else id(entry))
+                if bucket not in seen:
+                    seen.add(bucket)
+                    kept.appendleft(entry)
+                    continue
+            entry.live = False
+            self._bytes -= entry.size
+            self._evictions["thinning"] += 1
+        self._mementos = kept
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Live statistics on the history size and on how many mementos each
+        retention policy has evicted so far.
+        """
+        with self._lock:
+            stats = {"count": len(self._mementos), "bytes": self._bytes,
+                     "checkpoint_errors": self._checkpoint_errors}
+            stats.update({f"evicted_{reason}": count
+                          for reason, count in self._evictions.items()})
+        return stats
+
+    def _checkpoint(self, memento: ConcreteMemento) -> CompressedMemento:
+        """
+        Runs on the background worker.
+        """
+        checkpoint = CompressedMemento(memento)
+        if self._sink is not None:
+            self._sink(checkpoint.get_name(), checkpoint.get_payload())
+        return checkpoint
 
-        memento = self._mementos.pop() #se produce el cambio mediante la funcion pop()
-        print(f"Caretaker: Restoring state to: {memento.get_name()}")
-        try:
-            self._originator.restore(memento) #se restaura al estado original
-        except Exception:
-            self.undo()
+    def flush(self) -> None:
+        """
+        Blocks until every pending checkpoint has been written out, including
+        those of mementos already undone or evicted. The single worker writes
+        them in order, so waiting for the last one is enough.
+        """
+        if self._last_checkpoint is not None:
+            wait([self._last_checkpoint])
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self.flush()
+            self._executor.shutdown()
+
+    def undo(self) -> None:
+        """
+        Restores the newest memento. Mementos that fail to restore are
+        reported, discarded and the next older one is tried.
+        """
+        while len(self._mementos):
+            with self._lock:
+                entry = self._mementos.pop() #se produce el cambio mediante la funcion pop()
+                entry.live = False
+                self._bytes -= entry.size
+            try:
+                print(f"Caretaker: Restoring state to: {entry.memento.get_name()}")
+                self._originator.restore(entry.memento) #se restaura al estado original
+                return
+            except Exception as error:
+                print(f"Caretaker: Could not restore it: {error!r}")
 
     def show_history(self) -> None:
         print("Caretaker: Here's the list of mementos:")
-        for memento in self._mementos:
-            print(memento.get_name())
+        for entry in self._mementos:
+            print(entry.memento.get_name())
 
 
 if __name__ == "__main__":
@@ -150,4 +373,30 @@ if __name__ == "__main__":
 
     print("\nClient: Once more!\n")
     caretaker.undo()
-    
\ No newline at end of file
+
+    print("\nClient: Keeping only the last two saves.\n")
+    caretaker = Caretaker(originator, max_count=2)
+    for _ in range(3):
+        caretaker.backup()
+        originator.do_something()
+
+    print()
+    caretaker.show_history()
+    print(f"Caretaker: {caretaker.get_stats()}")
+
+    print("\nClient: Now with background checkpoints.\n")
+    written = []
+    caretaker = Caretaker(originator, async_checkpoints=True, max_in_flight=2,
+                          sink=lambda name, payload: written.append(len(payload)))
+
+    caretaker.backup()
+    originator.do_something()
+
+    caretaker.backup()
+    originator.do_something()
+
+    caretaker.flush()
+    print(f"\nCaretaker: {len(written)} checkpoints written ({sum(written)} bytes)")
+
+    caretaker.undo()
+    caretaker.close()
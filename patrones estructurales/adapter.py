@@ -1,3 +1,10 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
+import sys
+
+
 class Target:
     """
     The Target defines the domain-specific interface used by the client code.
@@ -12,8 +19,13 @@ class Adaptee:
     The Adaptee contains some useful behavior, but its interface is incompatible
     with the existing client code. The Adaptee needs some adaptation before the
     client code can use it.
+
+    `version` is bumped by adaptees whose output can change, so that cached
+    translations of it are discarded.
     """
 
+    version = 0
+
     def specific_request(self) -> str:
         return ".eetpadA eht fo roivaheb laicepS"
 
@@ -28,6 +40,307 @@ class Adapter(Target, Adaptee):
         return f"Adapter: (TRANSLATED) {self.specific_request()[::-1]}"
 
 
+class TranslationCache:
+    """
+    A thread-safe LRU cache of translated results, keyed on the translator
+    (the adapter's class) and the adaptee instance, so adapters that translate
+    the same adaptee differently don't see each other's results. Entries remember the adaptee's `version` when they were stored
+    and are dropped when it changes, or when they are older than `ttl`
+    seconds. One cache can be shared by any number of adapters and threads.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = monotonic) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "invalidated": 0,
+                       "evicted": 0}
+
+    def get(self, adaptee: Adaptee, translator: type) -> Optional[str]:
+        key = (translator, id(adaptee))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            _, version, expires, result = entry
+            if version != getattr(adaptee, "version", None):
+                del self._entries[key]
+                self._stats["invalidated"] += 1
+                self._stats["misses"] += 1
+                return None
+            if expires is not None and self._clock() >= expires:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return result
+
+    def put(self, adaptee: Adaptee, translator: type, result: str) -> None:
+        expires = None if self._ttl is None else self._clock() + self._ttl
+        # La entrada guarda una referencia al adaptee, así su id no se reutiliza
+        entry = (adaptee, getattr(adaptee, "version", None), expires, result)
+        key = (translator, id(adaptee))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evicted"] += 1
+
+    def invalidate(self, adaptee: Adaptee) -> None:
+        """
+        Drops the adaptee's translations, for every translator.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == id(adaptee)]:
+                del self._entries[key]
+                self._stats["invalidated"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "size": len(self._entries),
+                    "maxsize": self._maxsize}
+
+
+class ObjectAdapter(Target):
+    """
+    The Adapter via composition: it wraps an existing Adaptee instance instead
+    of inheriting from it, so one expensive adaptee can serve many requests.
+    With a TranslationCache, `request()` only calls the adaptee on a miss.
+    """
+
+    def __init__(self, adaptee: Adaptee,
+                 cache: Optional[TranslationCache] = None) -> None:
+        self._adaptee = adaptee
+        self._cache = cache
+
+    def translate(self) -> str:
+        return f"Adapter: (TRANSLATED) {self._adaptee.specific_request()[::-1]}"
+
+    def request(self) -> str:
+        if self._cache is None:
+            return self.translate()
+        result = self._cache.get(self._adaptee, type(self))
+        if result is None:
+            result = self.translate()
+            self._cache.put(self._adaptee, type(self), result)
+        return result
+
+
+class BufferAdaptee:
+    """
+    An Adaptee whose payload is binary, e.g. read straight from a file or a
+    socket, and possibly many megabytes long.
+    """
+
+    def __init__(self, payload: Union[bytes, bytearray, memoryview] = b".eetpadA eht fo roivaheb laicepS") -> None:
+        self._payload = payload
+
+    def specific_request(self) -> Union[bytes, bytearray, memoryview]:
+        return self._payload
+
+
+class TranslatedPayload:
+    """
+    The translation of a buffer payload as a lazy view: a prefix plus a
+    `memoryview` over the adaptee's buffer, read back to front. Nothing is
+    copied until the caller asks for bytes, either all at once with `tobytes()`
+    or in bounded pieces with `chunks()`.
+    """
+
+    def __init__(self, prefix: bytes, payload) -> None:
+        self._prefix = prefix
+        self._source = memoryview(payload).cast("B")
+
+    def __len__(self) -> int:
+        return len(self._prefix) + len(self._source)
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TranslatedPayload index out of range")
+        if index < len(self._prefix):
+            return self._prefix[index]
+        return self._source[len(self) - 1 - index]
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._prefix
+        yield from reversed(self._source)
+
+    def chunks(self, size: int = 1 << 20) -> Iterator[bytearray]:
+        yield self._prefix
+        for end in range(len(self._source), 0, -size):
+            chunk = bytearray(self._source[max(0, end - size):end])
+            chunk.reverse()
+            yield chunk
+
+    def tobytes(self) -> bytearray:
+        """
+        Materializes the translation into a single bytearray: the payload is
+        copied in once, followed by the reversed prefix, and the whole buffer
+        is then reversed in place.
+        """
+        out = bytearray(len(self))
+        with memoryview(out) as view:
+            view[:len(self._source)] = self._source
+            view[len(self._source):] = self._prefix[::-1]
+        out.reverse()
+        return out
+
+    def __str__(self) -> str:
+        return self.tobytes().decode("utf-8")
+
+
+class BufferAdapter(Target):
+    """
+    Adapts a BufferAdaptee without copying its payload: `request_view()`
+    translates by exposing the buffer reversed, byte by byte (so text payloads
+    should be ASCII, or use the plain Adapter). `request()` keeps the Target
+    interface and materializes the view.
+    """
+
+    def __init__(self, adaptee: BufferAdaptee) -> None:
+        self._adaptee = adaptee
+
+    def request_view(self) -> TranslatedPayload:
+        return TranslatedPayload(b"Adapter: (TRANSLATED) ", self._adaptee.specific_request())
+
+    def request(self) -> str:
+        return str(self.request_view())
+
+
+class StreamingAdaptee:
+    """
+    A legacy component that produces its output as a stream of records
+    instead of one string, e.g. lines read from a pipe. Each record has the
+    same weird format as the Adaptee's output, optionally ending in a newline.
+    """
+
+    def __init__(self, records: Optional[Iterable[str]] = None) -> None:
+        self._records = records
+
+    def specific_stream(self) -> Iterator[str]:
+        if self._records is None:
+            yield ".eetpadA eht fo roivaheb laicepS"
+        else:
+            yield from self._records
+
+
+class StreamingAdapter(Target):
+    """
+    Adapts a StreamingAdaptee incrementally: `stream()` pulls one record at a
+    time from the adaptee and yields its translation, so memory stays flat
+    whatever the size of the payload. Records are translated one by one,
+    which for a single record is exactly what the Adapter does. `request()`
+    is kept as a convenience that joins the stream.
+    """
+
+    def __init__(self, adaptee: StreamingAdaptee) -> None:
+        self._adaptee = adaptee
+
+    def stream(self) -> Iterator[str]:
+        yield "Adapter: (TRANSLATED) "
+        for record in self._adaptee.specific_stream():
+            if record.endswith("\n"):
+                yield record[-2::-1] + "\n"  # el salto de línea queda al final
+            else:
+                yield record[::-1]
+
+    def request(self) -> str:
+        return "".join(self.stream())
+
+
+def benchmark(size: int = 100 * 2**20) -> None:
+    """
+    Translates a `size`-byte payload with the string Adapter and with the
+    BufferAdapter, measuring latency and peak traced memory.
+    """
+    from time import perf_counter
+    import tracemalloc
+
+    text = Adaptee().specific_request()
+    text = text * (size // len(text))
+    payload = text.encode("ascii")
+
+    class LargeAdapter(Adapter):
+        def specific_request(self) -> str:
+            return text
+
+    adapter = BufferAdapter(BufferAdaptee(payload))
+    for name, translate in (("Adapter.request", LargeAdapter().request),
+                            ("BufferAdapter.request_view", adapter.request_view),
+                            ("BufferAdapter view + tobytes",
+                             lambda: adapter.request_view().tobytes())):
+        tracemalloc.start()
+        start = perf_counter()
+        result = translate()
+        elapsed = perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name}: {elapsed * 1e3:.1f} ms, peak {peak / 2**20:.1f} MiB")
+        del result
+
+
+def benchmark_cache(requests: int = 2000, threads: int = 8,
+                    cost: float = 0.001) -> None:
+    """
+    Serves `requests` from `threads` threads through ObjectAdapters over a
+    few adaptees whose `specific_request()` takes `cost` seconds, with and
+    without a shared TranslationCache, and prints the cache counters.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from time import perf_counter, sleep
+
+    class ExpensiveAdaptee(Adaptee):
+        def specific_request(self) -> str:
+            sleep(cost)
+            return super().specific_request()
+
+    adaptees = [ExpensiveAdaptee() for _ in range(16)]
+    cache = TranslationCache(maxsize=32, ttl=60)
+    for name, shared in (("no cache", None), ("TranslationCache", cache)):
+        adapters = [ObjectAdapter(adaptee, shared) for adaptee in adaptees]
+        start = perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(lambda i: adapters[i % len(adapters)].request(),
+                          range(requests)))
+        print(f"{name}: {perf_counter() - start:.3f} s for {requests} requests")
+    print(f"Cache: {cache.cache_info()}")
+
+
+def benchmark_stream(sizes: Iterable[int] = (2**20, 16 * 2**20, 128 * 2**20)) -> None:
+    """
+    Streams payloads of each size through a StreamingAdapter, consuming the
+    translated chunks as they come, and prints the peak traced memory, which
+    should not grow with the payload.
+    """
+    from time import perf_counter
+    import tracemalloc
+
+    record = ".eetpadA eht fo roivaheb laicepS\n" * 128
+    for size in sizes:
+        adaptee = StreamingAdaptee(record for _ in range(size // len(record)))
+        tracemalloc.start()
+        start = perf_counter()
+        total = sum(len(chunk) for chunk in StreamingAdapter(adaptee).stream())
+        elapsed = perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{total / 2**20:.0f} MiB streamed in {elapsed:.2f} s, "
+              f"peak {peak / 2**10:.1f} KiB")
+
+
 def client_code(target: "Target") -> None:
     """
     The client code supports all classes that follow the Target interface.
@@ -36,6 +349,16 @@ def client_code(target: "Target") -> None:
     print(target.request(), end="")
 
 
+def client_code_stream(target: StreamingAdapter) -> None:
+    """
+    The client code for streaming targets, which handles the translation
+    chunk by chunk as it arrives.
+    """
+
+    for chunk in target.stream():
+        print(chunk, end="", flush=True)
+
+
 if __name__ == "__main__":
     print("Client: I can work just fine with the Target objects:")
     target = Target()
@@ -50,4 +373,35 @@ if __name__ == "__main__":
     print("Client: But I can work with it via the Adapter:")
     adapter = Adapter()
     client_code(adapter)
-    
\ No newline at end of file
+    print("\n")
+
+    print("Client: Binary payloads are translated without copying them:")
+    buffer_adapter = BufferAdapter(BufferAdaptee())
+    client_code(buffer_adapter)
+    print("\n")
+
+    print("Client: An existing Adaptee can be wrapped, and its translation cached:")
+    cache = TranslationCache(maxsize=16, ttl=30)
+    object_adapter = ObjectAdapter(adaptee, cache)
+    client_code(object_adapter)
+    print()
+    client_code(object_adapter)
+    print()
+    adaptee.version += 1  # el adaptee cambió, la traducción se recalcula
+    client_code(object_adapter)
+    print(f"\nCache: {cache.cache_info()}")
+    print("\n")
+
+    print("Client: Streamed output is translated as it arrives:")
+    client_code_stream(StreamingAdapter(StreamingAdaptee()))
+    print()
+    lines = StreamingAdaptee([".eetpadA eht fo roivaheb laicepS\n"] * 3)
+    client_code_stream(StreamingAdapter(lines))
+
+    if "--bench" in sys.argv:
+        print("\n")
+        benchmark()
+        print()
+        benchmark_cache()
+        print()
+        benchmark_stream()
@@ -1,5 +1,16 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from math import tanh
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, List, Sequence
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional, ConcreteImplementationB funciona sin él
+    np = None
 
 
 class Abstraction:
@@ -16,6 +27,27 @@ class Abstraction:
         return (f"Abstraction: Base operation with:\n"
                 f"{self.implementation.operation_implementation()}")
 
+    def operation_many(self, inputs: Sequence[float]) -> List[float]:
+        """
+        Processes a whole batch of inputs with a single call when the
+        implementation supports it (`operation_implementation_many`), and one
+        input at a time otherwise. The results always come back as a list.
+        """
+        return self._operation_many(self.implementation, inputs)
+
+    @staticmethod
+    def _operation_many(implementation: Implementation,
+                        inputs: Sequence[float]) -> List[float]:
+        many = getattr(implementation, "operation_implementation_many", None)
+        if many is not None:
+            return many(inputs)
+        one = getattr(implementation, "operation_implementation_one", None)
+        if one is None:
+            raise TypeError(f"{type(implementation).__name__} doesn't support "
+                            f"batches: it defines neither operation_implementation_one "
+                            f"nor operation_implementation_many")
+        return [one(value) for value in inputs]
+
 
 class ExtendedAbstraction(Abstraction):
     """
@@ -27,6 +59,99 @@ class ExtendedAbstraction(Abstraction):
                 f"{self.implementation.operation_implementation()}")
 
 
+class AutoTuningAbstraction(Abstraction):
+    """
+    An Abstraction that is not tied to one Implementation: it times several
+    candidates on the live calls to `operation_many` and routes each
+    input-size class to the fastest one.
+
+    A batch of n inputs belongs to the first class in `size_classes` that is
+    >= n (plus one open class above the last bound). While a class is being
+    evaluated, its calls go round-robin to the candidates until each has
+    served `samples` of them; the one with the lowest time per input is then
+    used for the next `reevaluate_every` calls of that class, after which it
+    is evaluated again. `operation()` uses the first candidate.
+    """
+
+    def __init__(self, candidates: Sequence[Implementation],
+                 size_classes: Sequence[int] = (16, 1024, 65536),
+                 samples: int = 3, reevaluate_every: int = 1000,
+                 clock: Callable[[], float] = perf_counter) -> None:
+        super().__init__(candidates[0])
+        self._candidates = list(candidates)
+        self._bounds = sorted(size_classes)
+        self._samples = samples
+        self._reevaluate_every = reevaluate_every
+        self._clock = clock
+        self._lock = Lock()
+        self._classes = [self._new_class() for _ in range(len(self._bounds) + 1)]
+
+    def _new_class(self) -> Dict:
+        return {"chosen": None, "calls": 0, "evaluations": 0, "next": 0,
+                "timings": [[] for _ in self._candidates]}
+
+    def _label(self, index: int) -> str:
+        if index == len(self._bounds):
+            return f">{self._bounds[-1]}"
+        return f"<={self._bounds[index]}"
+
+    def operation_many(self, inputs: Sequence[float]) -> List[float]:
+        state = self._classes[bisect_left(self._bounds, len(inputs))]
+        with self._lock:
+            chosen = state["chosen"]
+            if chosen is not None and state["calls"] < self._reevaluate_every:
+                state["calls"] += 1
+            else:
+                if chosen is not None:
+                    # Toca reevaluar: se descartan los tiempos anteriores
+                    state["chosen"] = chosen = None
+                    state["timings"] = [[] for _ in self._candidates]
+                candidate = state["next"]
+                state["next"] = (candidate + 1) % len(self._candidates)
+        if chosen is not None:
+            return self._operation_many(self._candidates[chosen], inputs)
+
+        start = self._clock()
+        result = self._operation_many(self._candidates[candidate], inputs)
+        per_input = (self._clock() - start) / max(1, len(inputs))
+
+        with self._lock:
+            timings = state["timings"]
+            timings[candidate].append(per_input)
+            if state["chosen"] is None and all(len(t) >= self._samples for t in timings):
+                state["chosen"] = min(range(len(timings)), key=lambda i: min(timings[i]))
+                state["calls"] = 0
+                state["evaluations"] += 1
+        return result
+
+    def decisions(self) -> Dict[str, str]:
+        """
+        The implementation currently chosen for each size class, or None while
+        the class is being evaluated.
+        """
+        with self._lock:
+            return {self._label(index): (None if state["chosen"] is None else
+                                         type(self._candidates[state["chosen"]]).__name__)
+                    for index, state in enumerate(self._classes)}
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Per size class: the decision, how many evaluations were run, calls
+        since the last one, and the best measured time per input (in seconds)
+        of every candidate in the current evaluation.
+        """
+        with self._lock:
+            return {self._label(index): {
+                        "chosen": (None if state["chosen"] is None else
+                                   type(self._candidates[state["chosen"]]).__name__),
+                        "evaluations": state["evaluations"],
+                        "calls": state["calls"],
+                        "timings": {type(candidate).__name__: (min(times) if times else None)
+                                    for candidate, times in zip(self._candidates,
+                                                                state["timings"])}}
+                    for index, state in enumerate(self._classes)}
+
+
 class Implementation(ABC):
     """
     The Implementation defines the interface for all implementation classes. It
@@ -34,12 +159,25 @@ class Implementation(ABC):
     interfaces can be entirely different. Typically the Implementation interface
     provides only primitive operations, while the Abstraction defines higher-
     level operations based on those primitives.
+
+    Implementations used with `Abstraction.operation_many` also provide
+    `operation_implementation_one(value)`, applied to each input, and/or
+    `operation_implementation_many(values)`, which processes a whole batch and
+    returns a list.
     """
 
     @abstractmethod
     def operation_implementation(self) -> str:
         pass
 
+
+def _gelu(value: float) -> float:
+    """
+    The computation both platforms provide (the tanh approximation of GELU).
+    """
+    return 0.5 * value * (1.0 + tanh(0.7978845608 * (value + 0.044715 * value ** 3)))
+
+
 """
 Each Concrete Implementation corresponds to a specific platform and implements
 the Implementation interface using that platform's API.
@@ -48,11 +186,98 @@ class ConcreteImplementationA(Implementation):
     def operation_implementation(self) -> str:
         return "ConcreteImplementationA: Here's the result on the platform A."
 
+    def operation_implementation_one(self, value: float) -> float:
+        return _gelu(value)
+
 
 class ConcreteImplementationB(Implementation):
+    """
+    The vectorized platform: whole batches go through NumPy when it is
+    installed, and through a single tight loop otherwise (see `backend`).
+    """
+
+    backend = "numpy" if np is not None else "python"
+
     def operation_implementation(self) -> str:
         return "ConcreteImplementationB: Here's the result on the platform B."
 
+    def operation_implementation_one(self, value: float) -> float:
+        return _gelu(value)
+
+    def operation_implementation_many(self, values: Sequence[float]) -> List[float]:
+        if np is None:
+            # _gelu en línea, sin el coste de una llamada por elemento
+            return [0.5 * value * (1.0 + tanh(0.7978845608 * (value + 0.044715 * value ** 3)))
+                    for value in values]
+        values = np.asarray(values, dtype=np.float64)
+        return (0.5 * values * (1.0 + np.tanh(0.7978845608 * (values + 0.044715 * values ** 3)))
+                ).tolist()
+
+
+def benchmark(sizes: Sequence[int] = (1, 16, 1024, 65536, 1048576),
+              repeat: int = 3) -> None:
+    """
+    Times `Abstraction.operation_many` over batches of each size with the
+    per-input ConcreteImplementationA and the batched ConcreteImplementationB,
+    and checks that both compute the same results.
+    """
+    from random import Random
+    from time import perf_counter
+
+    print(f"ConcreteImplementationB backend: {ConcreteImplementationB.backend}")
+    rng = Random(0)
+    for size in sizes:
+        values = [rng.uniform(-4.0, 4.0) for _ in range(size)]
+        # A trabaja con floats de Python; B recibe el array ya convertido
+        vectorized = np.asarray(values) if np is not None else values
+        timings = {}
+        results = {}
+        for implementation, inputs in ((ConcreteImplementationA(), values),
+                                       (ConcreteImplementationB(), vectorized)):
+            abstraction = Abstraction(implementation)
+            best = float("inf")
+            for _ in range(repeat):
+                start = perf_counter()
+                result = abstraction.operation_many(inputs)
+                best = min(best, perf_counter() - start)
+            name = type(implementation).__name__
+            timings[name] = best
+            results[name] = result
+        assert all(abs(a - b) < 1e-9 for a, b in zip(*results.values()))
+        a, b = timings["ConcreteImplementationA"], timings["ConcreteImplementationB"]
+        print(f"{size:>8} inputs: A {a * 1e3:9.3f} ms, B {b * 1e3:9.3f} ms "
+              f"({a / b:.1f}x)")
+
+
+def benchmark_autotuning(calls: int = 3000, reevaluate_every: int = 500) -> None:
+    """
+    Serves the same mixed-size traffic through an Abstraction fixed to each
+    implementation and through an AutoTuningAbstraction over both, then
+    prints the decisions the latter made.
+    """
+    from random import Random
+
+    rng = Random(0)
+    sizes = [rng.choice((1, 8, 256, 4096)) for _ in range(calls)]
+    # El tráfico llega como listas de floats, sea cual sea la implementación
+    batches = {size: [rng.uniform(-4.0, 4.0) for _ in range(size)]
+               for size in set(sizes)}
+
+    candidates = [ConcreteImplementationA(), ConcreteImplementationB()]
+    abstractions: List = [(type(c).__name__, Abstraction(c)) for c in candidates]
+    tuned = AutoTuningAbstraction(candidates, reevaluate_every=reevaluate_every)
+    abstractions.append(("AutoTuningAbstraction", tuned))
+    for name, abstraction in abstractions:
+        start = perf_counter()
+        for size in sizes:
+            abstraction.operation_many(batches[size])
+        print(f"{name}: {perf_counter() - start:.3f} s")
+    for label, stats in tuned.get_stats().items():
+        timings = ", ".join(f"{n} {t * 1e9:.0f} ns/input" for n, t in stats["timings"].items()
+                            if t is not None)
+        print(f"  {label:>8}: {stats['chosen']} after {stats['evaluations']} "
+              f"evaluation(s) [{timings}]")
+
 
 def client_code(abstraction: Abstraction) -> None:
     """
@@ -83,4 +308,25 @@ if __name__ == "__main__":
     implementation = ConcreteImplementationB()
     abstraction = ExtendedAbstraction(implementation)
     client_code(abstraction)
+
+    print("\n")
+
+    print("Batches go through the implementation in a single call when it can:")
+    for implementation in (ConcreteImplementationA(), ConcreteImplementationB()):
+        results = Abstraction(implementation).operation_many([-1.0, 0.0, 1.0, 2.0])
+        print(f"{type(implementation).__name__}: "
+              f"{[round(float(result), 4) for result in results]}")
+
+    print("\nThe auto-tuning bridge picks an implementation per batch size:")
+    tuned = AutoTuningAbstraction([ConcreteImplementationA(), ConcreteImplementationB()],
+                                  samples=2)
+    for size in (4, 4, 4, 4, 2000, 2000, 2000, 2000):
+        tuned.operation_many([0.5] * size)
+    print(tuned.decisions())
+
+    if "--bench" in sys.argv:
+        print()
+        benchmark()
+        print()
+        benchmark_autotuning()
     
\ No newline at end of file